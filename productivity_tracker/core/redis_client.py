@@ -5,13 +5,38 @@ import logging
 from typing import Any
 from uuid import UUID
 
-import redis
-from redis import Redis
+from redis import ConnectionPool, Redis
 
 from productivity_tracker.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by every RedisClient, keyed by URL and created on first connect
+_connection_pools: dict[str, ConnectionPool] = {}
+
+
+def get_connection_pool(url: str) -> ConnectionPool:
+    """Get the shared Redis connection pool for ``url``, creating it on first use."""
+    pool = _connection_pools.get(url)
+    if pool is None:
+        pool = _connection_pools[url] = ConnectionPool.from_url(
+            url,
+            max_connections=settings.REDIS_POOL_SIZE,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            retry_on_timeout=True,
+        )
+    return pool
+
+
+def reset_connection_pools() -> None:
+    """Disconnect and discard the shared pools so the next connect builds new ones."""
+    for pool in _connection_pools.values():
+        pool.disconnect()
+    _connection_pools.clear()
+
 
 class RedisClient:
     """Redis client for managing user sessions."""
@@ -28,14 +53,7 @@ class RedisClient:
             return
 
         try:
-            self._client = redis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-            )
+            self._client = Redis(connection_pool=get_connection_pool(settings.REDIS_URL))
             # Test connection
             self._client.ping()
             logger.info("Connected to Redis successfully")
@@ -79,7 +97,7 @@ class RedisClient:
 
             # Use pipeline to set session and record the index atomically
             pipe = self._client.pipeline()
-            pipe.setex(key, ttl, json.dumps(session_data))
+            pipe.set(key, json.dumps(session_data), ex=ttl)
             pipe.sadd(user_key, session_id)
             pipe.execute()
 
@@ -131,9 +149,10 @@ class RedisClient:
                 if user_id:
                     user_key = f"user_sessions:{user_id}"
 
-            # Use pipeline to remove session and update index
+            # Use pipeline to remove session and update index; UNLINK frees memory
+            # in the background instead of blocking the server
             pipe = self._client.pipeline()
-            pipe.delete(key)
+            pipe.unlink(key)
             if user_key:
                 pipe.srem(user_key, session_id)
             pipe.execute()
@@ -144,6 +163,39 @@ class RedisClient:
             logger.error(f"Failed to delete session: {e}")
             return False
 
+    def delete_sessions(self, session_ids: list[str]) -> int:
+        """
+        Delete several sessions and remove them from their users' session sets.
+
+        Session data is fetched with a single MGET and all removals are sent in one
+        non-transactional pipeline, so the cost is two round trips regardless of count.
+
+        Returns:
+            Number of sessions deleted
+        """
+        if not self._client or not session_ids:
+            return 0
+
+        try:
+            keys = [f"session:{sid}" for sid in session_ids]
+            payloads = self._client.mget(keys)
+
+            pipe = self._client.pipeline(transaction=False)
+            pipe.unlink(*keys)
+            for session_id, data in zip(session_ids, payloads, strict=True):
+                if data:
+                    user_id = json.loads(str(data)).get("user_id")
+                    if user_id:
+                        pipe.srem(f"user_sessions:{user_id}", session_id)
+            results = pipe.execute()
+
+            deleted = int(results[0]) if results else 0
+            logger.debug(f"Deleted {deleted} sessions")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to delete sessions: {e}")
+            return 0
+
     def delete_user_sessions(self, user_id: UUID) -> int:
         """
         Delete all sessions for a user using the user-to-sessions index set.
@@ -165,8 +217,8 @@ class RedisClient:
             session_keys = [f"session:{sid}" for sid in session_ids]
             pipe = self._client.pipeline()
             if session_keys:
-                pipe.delete(*session_keys)
-            pipe.delete(user_key)
+                pipe.unlink(*session_keys)
+            pipe.unlink(user_key)
             results = pipe.execute()
 
             deleted = results[0] if results else 0
@@ -219,6 +271,7 @@ class RedisClient:
         """Close Redis connection."""
         if self._client:
             self._client.close()
+            self._client = None
             logger.info("Redis connection closed")
 
 
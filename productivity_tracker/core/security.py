@@ -1,7 +1,9 @@
 """Security utilities for password hashing and JWT tokens."""
 
+import time
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import jwt
 from argon2 import PasswordHasher
@@ -67,12 +69,26 @@ def create_refresh_token(data: dict, expires_delta: timedelta | None = None) ->
     return str(encoded_jwt)
 
 
+@lru_cache(maxsize=2048)
+def _decode_verified(token: str, secret_key: str, algorithm: str) -> dict:
+    """Verify a JWT token's signature and claims, caching successful results.
+
+    Only valid tokens are cached; anything that raises is verified again next time.
+    """
+    return dict(jwt.decode(token, secret_key, algorithms=[algorithm]))
+
+
 def decode_token(token: str) -> dict | None:
     """Decode and verify a JWT token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return dict(payload) if payload else None
+        payload = _decode_verified(token, settings.SECRET_KEY, settings.ALGORITHM)
     except jwt.ExpiredSignatureError:
         return None
     except jwt.PyJWTError:
         return None
+
+    # A cached token may have expired since it was first verified
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        return None
+    return dict(payload) if payload else None
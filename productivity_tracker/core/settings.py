@@ -20,6 +20,7 @@ class Settings(BaseSettings):
 
     # Cache - optional (add when needed)
     REDIS_URL: str | None = None
+    REDIS_POOL_SIZE: int = 50
 
     # Blob Storage - optional (add when needed)
     MINIO_ENDPOINT: str | None = None
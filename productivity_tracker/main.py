@@ -3,7 +3,7 @@ from fastapi import FastAPI
 from productivity_tracker.api.setup import setup_versioned_routers
 from productivity_tracker.core.database import Base, engine
 from productivity_tracker.core.logging_config import get_logger, setup_logging
-from productivity_tracker.core.redis_client import redis_client
+from productivity_tracker.core.redis_client import redis_client, reset_connection_pools
 from productivity_tracker.core.settings import settings
 from productivity_tracker.core.setup import setup_exception_handling, setup_middleware
 from productivity_tracker.versioning.version import __version__
@@ -59,5 +59,6 @@ async def shutdown_event():
     """Run on application shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
 
-    # Close Redis connection
+    # Close Redis connection and release the shared pools
     redis_client.close()
+    reset_connection_pools()
@@ -4,7 +4,7 @@ from typing import cast
 from uuid import UUID
 
 from pydantic import EmailStr
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from productivity_tracker.database.entities.role import Role
 from productivity_tracker.database.entities.user import User
@@ -19,14 +19,28 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, db: Session):
         super().__init__(User, db)
 
+    def get_by_id(
+        self, id: UUID, include_deleted: bool = False, with_password: bool = False
+    ) -> User | None:
+        """Get user by ID, optionally including the deferred password hash."""
+        if not with_password:
+            return super().get_by_id(id, include_deleted=include_deleted)
+        # Ensure any pending changes are flushed before querying
+        self.db.flush()
+        query = self.db.query(User).options(undefer(User.hashed_password)).filter(User.id == id)
+        if not include_deleted:
+            query = query.filter(User.is_deleted == False)  # noqa: E712
+        return cast(User | None, query.first())
+
     def get_by_username(self, username: str) -> User | None:
-        """Get user by username."""
+        """Get user by username, including the deferred password hash."""
         logger.debug(f"Querying user by username: {username}")
         # Ensure any pending changes are flushed before querying
         self.db.flush()
         user = cast(
             User | None,
             self.db.query(User)
+            .options(undefer(User.hashed_password))
             .filter(User.username == username, User.is_deleted == False)  # noqa: E712
             .first(),
         )
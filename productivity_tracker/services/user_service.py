@@ -117,7 +117,9 @@ class UserService:
 
     def update_password(self, user_id: UUID, password_data: UserPasswordUpdate) -> User:
         """Update user password."""
-        user = self.get_user(user_id)
+        user = self.repository.get_by_id(user_id, with_password=True)
+        if not user:
+            raise ResourceNotFoundError(resource_type="User", resource_id=str(user_id))
 
         # Verify current password
         if not verify_password(password_data.current_password, str(user.hashed_password)):
@@ -1,5 +1,7 @@
 """Integration tests for authentication endpoints."""
 
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -74,8 +76,6 @@ class TestAuthenticationEndpoints:
     ):
         """Test registration fails with duplicate username."""
         # Arrange
-        from uuid import uuid4
-
         unique_suffix = uuid4().hex
         user_data = {
             "username": sample_user_integration.username,
@@ -225,18 +225,11 @@ class TestAuthenticationEndpoints:
     # ============================================================================
 
     def test_get_current_user_success(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test getting current authenticated user."""
         # Arrange - Login first
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.get(f"{API_PREFIX}/auth/me")
@@ -266,16 +259,12 @@ class TestAuthenticationEndpoints:
     # Logout Tests
     # ============================================================================
 
-    def test_logout_success(self, client_integration: TestClient, sample_user_integration: User):
+    def test_logout_success(
+        self, client_integration: TestClient, sample_user_integration: User, login_as
+    ):
         """Test successful logout."""
         # Arrange - Login first
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.post(f"{API_PREFIX}/auth/logout")
@@ -290,18 +279,11 @@ class TestAuthenticationEndpoints:
     # ============================================================================
 
     def test_refresh_token_success(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test successful token refresh."""
         # Arrange - Login to get refresh token
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        refresh_token = login_response.json()["refresh_token"]
+        refresh_token = login_as(sample_user_integration)["refresh_token"]
 
         # Act
         response = client_integration.post(
@@ -338,17 +320,11 @@ class TestAuthenticationEndpoints:
     # ============================================================================
 
     def test_update_current_user_success(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test updating current user information."""
         # Arrange - Login first
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.put(
@@ -377,17 +353,11 @@ class TestAuthenticationEndpoints:
     # ============================================================================
 
     def test_change_password_success(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test successful password change."""
         # Arrange - Login first
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.put(
@@ -415,17 +385,11 @@ class TestAuthenticationEndpoints:
         assert new_login_response.status_code == 200
 
     def test_change_password_wrong_current(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test password change fails with wrong current password."""
         # Arrange - Login first
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.put(
@@ -455,16 +419,11 @@ class TestAdminUserEndpoints:
         client_integration: TestClient,
         sample_superuser_integration: User,
         sample_user_integration: User,
+        login_as,
     ):
         """Test superuser can get all users."""
         # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        login_as(sample_superuser_integration)
 
         # Act
         response = client_integration.get(f"{API_PREFIX}/auth/users")
@@ -476,17 +435,11 @@ class TestAdminUserEndpoints:
         assert len(data) >= 2
 
     def test_get_all_users_as_regular_user(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_as
     ):
         """Test regular user cannot get all users."""
         # Arrange - Login as regular user
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        login_as(sample_user_integration)
 
         # Act
         response = client_integration.get(f"{API_PREFIX}/auth/users")
@@ -506,16 +459,11 @@ class TestAdminUserEndpoints:
         client_integration: TestClient,
         sample_superuser_integration: User,
         sample_inactive_user_integration: User,
+        login_as,
     ):
         """Test superuser can activate a user."""
         # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        login_as(sample_superuser_integration)
 
         # Act
         response = client_integration.post(
@@ -532,16 +480,11 @@ class TestAdminUserEndpoints:
         client_integration: TestClient,
         sample_superuser_integration: User,
         sample_user_integration: User,
+        login_as,
     ):
         """Test superuser can deactivate a user."""
         # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        login_as(sample_superuser_integration)
 
         # Act
         response = client_integration.post(
@@ -1,22 +1,64 @@
 """Tests for Redis session management in authentication endpoints."""
 
-from unittest.mock import MagicMock, patch
+import json
+from collections.abc import Callable
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
 from productivity_tracker.core.redis_client import RedisClient
+from productivity_tracker.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+from productivity_tracker.core.settings import settings
 from productivity_tracker.database.entities import User
 from productivity_tracker.versioning.versioning import CURRENT_VERSION
 
 pytestmark = pytest.mark.integration
 
 API_PREFIX = CURRENT_VERSION.api_prefix
+LOGIN_URL = f"{API_PREFIX}/auth/login"
+LOGOUT_URL = f"{API_PREFIX}/auth/logout"
+REFRESH_URL = f"{API_PREFIX}/auth/refresh"
+JSON_HEADERS = {"content-type": "application/json"}
 
-# Update this to match your actual auth module path
-AUTH_MODULE = "productivity_tracker.api.auth"
 
+def get_jti(token: str) -> str:
+    """Extract the session ID (jti) from an access token."""
+    payload = decode_token(token)
+    assert payload is not None
+    return str(payload["jti"])
 
+
+def login(client: TestClient, body: bytes) -> dict[str, str]:
+    """Log in through the endpoint and return the token response, parsed once."""
+    response = client.post(LOGIN_URL, content=body, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def login_body(sample_user_integration: User) -> bytes:
+    """Login request body for the sample user, serialized once per test."""
+    return json.dumps(
+        {"username": sample_user_integration.username, "password": "TestPassword123!"}
+    ).encode()
+
+
+@pytest.fixture
+def auth_tokens(fake_redis: RedisClient, login_as, sample_user_integration: User) -> dict[str, str]:
+    """Access and refresh tokens for the sample user, minted without a password check.
+
+    Tests that exercise login itself keep posting to the endpoint; the rest only need
+    a valid session to act on.
+    """
+    return login_as(sample_user_integration)
+
+
+@pytest.mark.usefixtures("fake_redis")
 class TestAuthRedisSessionManagement:
     """Tests for Redis session management in authentication endpoints."""
 
@@ -27,321 +69,220 @@ class TestAuthRedisSessionManagement:
     # ============================================================================
 
     def test_login_creates_redis_session(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        login_body: bytes,
+        fake_redis: RedisClient,
     ):
         """Test that login creates a session in Redis."""
-        # Arrange
-        login_data = {
-            "username": sample_user_integration.username,
-            "password": "TestPassword123!",
-        }
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
-
-            # Act
-            response = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
+        # Act
+        tokens = login(client_integration, login_body)
 
-            # Assert
-            assert response.status_code == 200
-            mock_redis.create_session.assert_called_once()
+        # Assert
+        session = fake_redis.get_session(get_jti(tokens["access_token"]))
+        assert session is not None
+        assert session["user_id"] == str(sample_user_integration.id)
 
     def test_login_handles_redis_disconnection(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        login_body: bytes,
+        fake_redis: RedisClient,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test that login succeeds even if Redis is disconnected."""
         # Arrange
-        login_data = {
-            "username": sample_user_integration.username,
-            "password": "TestPassword123!",
-        }
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = False
-            mock_get_redis.return_value = mock_redis
+        store = fake_redis._client
+        assert store is not None
+        monkeypatch.setattr(fake_redis, "_client", None)
 
-            # Act
-            response = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
+        # Act
+        response = client_integration.post(LOGIN_URL, content=login_body, headers=JSON_HEADERS)
 
-            # Assert
-            assert response.status_code == 200
-            mock_redis.create_session.assert_not_called()
+        # Assert
+        assert response.status_code == 200
+        assert store.dbsize() == 0
 
     def test_login_redis_session_ttl_matches_token_expiry(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        login_body: bytes,
+        fake_redis: RedisClient,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test that Redis session TTL matches access token expiry."""
         # Arrange
-        login_data = {
-            "username": sample_user_integration.username,
-            "password": "TestPassword123!",
-        }
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.settings.ACCESS_TOKEN_EXPIRE_MINUTES", 30):
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_redis.create_session.return_value = True
-                mock_get_redis.return_value = mock_redis
+        monkeypatch.setattr(settings, "ACCESS_TOKEN_EXPIRE_MINUTES", 30)
 
-                # Act
-                response = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
+        # Act
+        tokens = login(client_integration, login_body)
 
-                # Assert
-                assert response.status_code == 200
-                mock_redis.create_session.assert_called_once()
+        # Assert
+        jti = get_jti(tokens["access_token"])
+        assert fake_redis._client is not None
+        assert 29 * 60 < fake_redis._client.ttl(f"session:{jti}") <= 30 * 60
 
     # ============================================================================
     # Logout - Redis Session Deletion Tests
     # ============================================================================
 
     def test_logout_deletes_redis_session(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        fake_redis: RedisClient,
+        auth_tokens: dict[str, str],
     ):
         """Test that logout deletes the session from Redis when token is provided as query param."""
-        # Arrange - Login first
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
+        # Arrange
+        access_token = auth_tokens["access_token"]
+        jti = get_jti(access_token)
+        assert fake_redis.get_session(jti) is not None
+
+        # Act - Send token as query parameter (matching the function signature)
+        response = client_integration.post(
+            LOGOUT_URL,
+            params={"access_token": access_token},
         )
-        assert login_response.status_code == 200
-        access_token = login_response.json()["access_token"]
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_redis.delete_session.return_value = True
-                mock_get_redis.return_value = mock_redis
-
-                # Mock decode_token to return a valid payload with jti
-                mock_decode.return_value = {
-                    "jti": "test-jti-123",
-                    "sub": str(sample_user_integration.id),
-                }
-
-                # Act - Send token as query parameter (matching the function signature)
-                response = client_integration.post(
-                    f"{API_PREFIX}/auth/logout",
-                    params={"access_token": access_token},
-                )
-
-                # Assert
-                assert response.status_code == 200
-                mock_decode.assert_called_once_with(access_token)
-                mock_redis.delete_session.assert_called_once_with("test-jti-123")
-
-    def test_logout_handles_redis_disconnection(
-        self, client_integration: TestClient, sample_user_integration: User
+
+        # Assert
+        assert response.status_code == 200
+        assert fake_redis.get_session(jti) is None
+        assert fake_redis.get_user_sessions_count(sample_user_integration.id) == 0
+
+    @pytest.mark.parametrize(
+        ("make_token", "connected"),
+        [
+            pytest.param(lambda access_token: None, True, id="no-token"),
+            pytest.param(lambda access_token: "invalid_token", True, id="invalid-token"),
+            # Refresh tokens carry no jti claim
+            pytest.param(
+                lambda access_token: create_refresh_token(data={"sub": "user-id"}),
+                True,
+                id="no-jti-claim",
+            ),
+            pytest.param(lambda access_token: access_token, False, id="redis-disconnected"),
+        ],
+    )
+    def test_logout_keeps_redis_session(
+        self,
+        client_integration: TestClient,
+        fake_redis: RedisClient,
+        monkeypatch: pytest.MonkeyPatch,
+        make_token: Callable[[str], str | None],
+        connected: bool,
     ):
-        """Test that logout succeeds even if Redis is disconnected."""
-        # Arrange - Login first
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
-        access_token = login_response.json()["access_token"]
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = False
-                mock_get_redis.return_value = mock_redis
-                mock_decode.return_value = {"jti": "test-jti-123"}
-
-                # Act
-                response = client_integration.post(
-                    f"{API_PREFIX}/auth/logout",
-                    params={"access_token": access_token},
-                )
-
-                # Assert
-                assert response.status_code == 200
-                mock_redis.delete_session.assert_not_called()
-
-    def test_logout_without_token(self, client_integration: TestClient):
-        """Test logout without access token."""
-        # Arrange
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_get_redis.return_value = mock_redis
-
-                # Act
-                response = client_integration.post(f"{API_PREFIX}/auth/logout")
-
-                # Assert
-                assert response.status_code == 200
-                mock_decode.assert_not_called()
-                mock_redis.delete_session.assert_not_called()
-
-    def test_logout_with_invalid_token(self, client_integration: TestClient):
-        """Test logout with invalid token doesn't call Redis delete."""
+        """Test that logout succeeds without deleting a session it cannot identify."""
         # Arrange
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_get_redis.return_value = mock_redis
-                mock_decode.return_value = None
-
-                # Act
-                response = client_integration.post(
-                    f"{API_PREFIX}/auth/logout",
-                    params={"access_token": "invalid_token"},
-                )
-
-                # Assert
-                assert response.status_code == 200
-                mock_redis.delete_session.assert_not_called()
-
-    def test_logout_with_no_jti_claim(self, client_integration: TestClient):
-        """Test logout with token that has no jti claim."""
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_get_redis.return_value = mock_redis
-                mock_decode.return_value = {"sub": "user-id"}
-
-                # Act
-                response = client_integration.post(
-                    f"{API_PREFIX}/auth/logout",
-                    params={"access_token": "some_token"},
-                )
-
-                # Assert
-                assert response.status_code == 200
-                mock_redis.delete_session.assert_not_called()
+        access_token, jti = create_access_token(data={"sub": str(uuid4())})
+        fake_redis.create_session(session_id=jti, user_id=uuid4())
+        store = fake_redis._client
+        assert store is not None
+        if not connected:
+            monkeypatch.setattr(fake_redis, "_client", None)
+        token = make_token(access_token)
+
+        # Act
+        response = client_integration.post(
+            LOGOUT_URL,
+            params={"access_token": token} if token else None,
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert store.exists(f"session:{jti}")
 
     # ============================================================================
     # Refresh Token - Redis Session Creation Tests
     # ============================================================================
 
     def test_refresh_token_creates_new_redis_session(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        fake_redis: RedisClient,
+        auth_tokens: dict[str, str],
     ):
         """Test that token refresh creates a new session in Redis."""
-        # Arrange - Login to get refresh token
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
-        refresh_token = login_response.json()["refresh_token"]
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
+        # Arrange
+        refresh_token = auth_tokens["refresh_token"]
 
-            # Act
-            response = client_integration.post(
-                f"{API_PREFIX}/auth/refresh",
-                json={"refresh_token": refresh_token},
-            )
+        # Act
+        response = client_integration.post(
+            REFRESH_URL,
+            json={"refresh_token": refresh_token},
+        )
 
-            # Assert
-            assert response.status_code == 200
-            mock_redis.create_session.assert_called_once()
+        # Assert
+        assert response.status_code == 200
+        session = fake_redis.get_session(get_jti(response.json()["access_token"]))
+        assert session is not None
+        assert session["user_id"] == str(sample_user_integration.id)
 
     def test_refresh_token_handles_redis_disconnection(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        fake_redis: RedisClient,
+        auth_tokens: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test that token refresh succeeds even if Redis is disconnected."""
-        # Arrange - Login to get refresh token
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
-        refresh_token = login_response.json()["refresh_token"]
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = False
-            mock_get_redis.return_value = mock_redis
+        # Arrange
+        refresh_token = auth_tokens["refresh_token"]
+        store = fake_redis._client
+        assert store is not None
+        monkeypatch.setattr(fake_redis, "_client", None)
 
-            # Act
-            response = client_integration.post(
-                f"{API_PREFIX}/auth/refresh",
-                json={"refresh_token": refresh_token},
-            )
+        # Act
+        response = client_integration.post(
+            REFRESH_URL,
+            json={"refresh_token": refresh_token},
+        )
 
-            # Assert
-            assert response.status_code == 200
-            mock_redis.create_session.assert_not_called()
+        # Assert
+        assert response.status_code == 200
+        assert not store.exists(f"session:{get_jti(response.json()['access_token'])}")
 
     def test_refresh_token_new_jti_generates_new_session_id(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        fake_redis: RedisClient,
+        auth_tokens: dict[str, str],
     ):
         """Test that refresh token generates a new session ID (jti) in Redis."""
-        # Arrange - Login to get refresh token
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
-        refresh_token = login_response.json()["refresh_token"]
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
+        # Arrange
+        login_jti = get_jti(auth_tokens["access_token"])
+        refresh_token = auth_tokens["refresh_token"]
 
-            # Act
-            response = client_integration.post(
-                f"{API_PREFIX}/auth/refresh",
-                json={"refresh_token": refresh_token},
-            )
+        # Act
+        response = client_integration.post(
+            REFRESH_URL,
+            json={"refresh_token": refresh_token},
+        )
 
-            # Assert
-            assert response.status_code == 200
-            mock_redis.create_session.assert_called_once()
+        # Assert
+        assert response.status_code == 200
+        refreshed_jti = get_jti(response.json()["access_token"])
+        assert refreshed_jti != login_jti
+        assert fake_redis.get_session(login_jti) is not None
+        assert fake_redis.get_session(refreshed_jti) is not None
 
     # ============================================================================
     # Cookie Deletion Tests
     # ============================================================================
 
     def test_logout_deletes_cookie(
-        self, client_integration: TestClient, sample_user_integration: User
+        self, client_integration: TestClient, sample_user_integration: User, login_body: bytes
     ):
         """Test that logout deletes the authentication cookie."""
         # Arrange - Login first
-        login_response = client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-        assert login_response.status_code == 200
+        login(client_integration, login_body)
 
         # Act
-        response = client_integration.post(f"{API_PREFIX}/auth/logout")
+        response = client_integration.post(LOGOUT_URL)
 
         # Assert
         assert response.status_code == 200
@@ -355,74 +296,43 @@ class TestAuthRedisSessionManagement:
     # ============================================================================
 
     def test_multiple_logins_create_separate_sessions(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        login_body: bytes,
+        fake_redis: RedisClient,
     ):
         """Test that multiple logins from same user create separate Redis sessions."""
-        # Arrange
-        login_data = {
-            "username": sample_user_integration.username,
-            "password": "TestPassword123!",
-        }
-
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
-
-            # Act - Login twice
-            response1 = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
-            response2 = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
-
-            # Assert
-            assert response1.status_code == 200
-            assert response2.status_code == 200
-            assert mock_redis.create_session.call_count == 2
+        # Act - Login twice
+        login(client_integration, login_body)
+        login(client_integration, login_body)
+
+        # Assert
+        assert fake_redis.get_user_sessions_count(sample_user_integration.id) == 2
 
     def test_logout_then_login_creates_new_session(
-        self, client_integration: TestClient, sample_user_integration: User
+        self,
+        client_integration: TestClient,
+        sample_user_integration: User,
+        login_body: bytes,
+        fake_redis: RedisClient,
+        auth_tokens: dict[str, str],
     ):
         """Test that after logout, login creates a new session."""
-        login_data = {
-            "username": sample_user_integration.username,
-            "password": "TestPassword123!",
-        }
-
         # First login
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
-
-            login_response = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
-            assert login_response.status_code == 200
-            access_token = login_response.json()["access_token"]
+        access_token = auth_tokens["access_token"]
+        first_jti = get_jti(access_token)
 
         # Logout
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            with patch(f"{AUTH_MODULE}.decode_token") as mock_decode:
-                mock_redis = MagicMock(spec=RedisClient)
-                mock_redis.is_connected = True
-                mock_redis.delete_session.return_value = True
-                mock_get_redis.return_value = mock_redis
-                mock_decode.return_value = {"jti": "session-1"}
-
-                logout_response = client_integration.post(
-                    f"{API_PREFIX}/auth/logout",
-                    params={"access_token": access_token},
-                )
-                assert logout_response.status_code == 200
-                mock_redis.delete_session.assert_called_once_with("session-1")
+        logout_response = client_integration.post(
+            LOGOUT_URL,
+            params={"access_token": access_token},
+        )
+        assert logout_response.status_code == 200
+        assert fake_redis.get_session(first_jti) is None
 
         # Login again
-        with patch(f"{AUTH_MODULE}.get_redis_client") as mock_get_redis:
-            mock_redis = MagicMock(spec=RedisClient)
-            mock_redis.is_connected = True
-            mock_redis.create_session.return_value = True
-            mock_get_redis.return_value = mock_redis
-
-            login_response2 = client_integration.post(f"{API_PREFIX}/auth/login", json=login_data)
-
-            assert login_response2.status_code == 200
-            mock_redis.create_session.assert_called_once()
+        second_jti = get_jti(login(client_integration, login_body)["access_token"])
+        assert second_jti != first_jti
+        assert fake_redis.get_session(second_jti) is not None
+        assert fake_redis.get_user_sessions_count(sample_user_integration.id) == 1
@@ -1,20 +1,29 @@
 """Integration tests for department endpoints."""
 
+from uuid import UUID, uuid4
+
 import pytest
 from fastapi import status
 
 from productivity_tracker.versioning import CURRENT_VERSION
 from tests.utilities import assert_problem_detail_response
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+# All tests share one event loop instead of creating a new loop per test
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
 
 API_PREFIX = CURRENT_VERSION.api_prefix
+DEPARTMENTS_URL = f"{API_PREFIX}/departments"
+
+
+def department_url(department_id: UUID) -> str:
+    """Build the URL for a single department."""
+    return f"{DEPARTMENTS_URL}/{department_id}"
 
 
 class TestDepartmentCreation:
     """Test department creation endpoints."""
 
-    async def test_create_department_success(self, authenticated_client, test_organization):
+    async def test_create_department_success(self, authenticated_async_client, test_organization):
         """Should create department successfully."""
         data = {
             "name": "Engineering",
@@ -22,7 +31,7 @@ class TestDepartmentCreation:
             "description": "Engineering department",
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/departments", json=data)
+        response = await authenticated_async_client.post(DEPARTMENTS_URL, json=data)
 
         assert response.status_code == status.HTTP_201_CREATED
         dept = response.json()
@@ -32,27 +41,25 @@ class TestDepartmentCreation:
         assert "id" in dept
         assert "created_at" in dept
 
-    async def test_create_department_invalid_organization(self, authenticated_client):
+    async def test_create_department_invalid_organization(self, authenticated_async_client):
         """Should reject invalid organization ID."""
-        from uuid import uuid4
-
         data = {
             "name": "Engineering",
             "organization_id": str(uuid4()),
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/departments", json=data)
+        response = await authenticated_async_client.post(DEPARTMENTS_URL, json=data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert_problem_detail_response(
             response.json(), "resource-not-found", status.HTTP_404_NOT_FOUND
         )
 
-    async def test_create_department_missing_required_fields(self, authenticated_client):
+    async def test_create_department_missing_required_fields(self, authenticated_async_client):
         """Should reject missing required fields."""
         data = {"name": ""}  # Empty name
 
-        response = authenticated_client.post(f"{API_PREFIX}/departments", json=data)
+        response = await authenticated_async_client.post(DEPARTMENTS_URL, json=data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -63,7 +70,7 @@ class TestDepartmentCreation:
             "organization_id": str(test_organization.id),
         }
 
-        response = client_integration.post(f"{API_PREFIX}/departments", json=data)
+        response = client_integration.post(DEPARTMENTS_URL, json=data)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -71,9 +78,9 @@ class TestDepartmentCreation:
 class TestDepartmentRetrieval:
     """Test department retrieval endpoints."""
 
-    async def test_get_all_departments(self, authenticated_client, test_department):
+    async def test_get_all_departments(self, authenticated_async_client, test_department):
         """Should get all departments."""
-        response = authenticated_client.get(f"{API_PREFIX}/departments")
+        response = await authenticated_async_client.get(DEPARTMENTS_URL)
 
         assert response.status_code == status.HTTP_200_OK
         depts = response.json()
@@ -81,9 +88,9 @@ class TestDepartmentRetrieval:
         assert len(depts) >= 1
         assert any(dept["id"] == str(test_department.id) for dept in depts)
 
-    async def test_get_department_by_id(self, authenticated_client, test_department):
+    async def test_get_department_by_id(self, authenticated_async_client, test_department):
         """Should get department by ID."""
-        response = authenticated_client.get(f"{API_PREFIX}/departments/{test_department.id}")
+        response = await authenticated_async_client.get(department_url(test_department.id))
 
         assert response.status_code == status.HTTP_200_OK
         dept = response.json()
@@ -92,11 +99,11 @@ class TestDepartmentRetrieval:
         assert dept["organization_id"] == str(test_department.organization_id)
 
     async def test_get_departments_by_organization(
-        self, authenticated_client, test_organization, test_department
+        self, authenticated_async_client, test_organization, test_department
     ):
         """Should get departments by organization."""
-        response = authenticated_client.get(
-            f"/api/v1.1/organizations/{test_organization.id}/departments"
+        response = await authenticated_async_client.get(
+            f"{API_PREFIX}/organizations/{test_organization.id}/departments"
         )
 
         assert response.status_code == status.HTTP_200_OK
@@ -105,31 +112,19 @@ class TestDepartmentRetrieval:
         assert len(depts) >= 1
         assert all(dept["organization_id"] == str(test_organization.id) for dept in depts)
 
-    async def test_get_department_not_found(self, authenticated_client):
-        """Should return 404 for non-existent department."""
-        from uuid import uuid4
-
-        fake_id = uuid4()
-        response = authenticated_client.get(f"{API_PREFIX}/departments/{fake_id}")
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert_problem_detail_response(
-            response.json(), "resource-not-found", status.HTTP_404_NOT_FOUND
-        )
-
 
 class TestDepartmentUpdate:
     """Test department update endpoints."""
 
-    async def test_update_department_success(self, authenticated_client, test_department):
+    async def test_update_department_success(self, authenticated_async_client, test_department):
         """Should update department successfully."""
         data = {
             "name": "Updated Department",
             "description": "Updated description",
         }
 
-        response = authenticated_client.put(
-            f"{API_PREFIX}/departments/{test_department.id}", json=data
+        response = await authenticated_async_client.put(
+            department_url(test_department.id), json=data
         )
 
         assert response.status_code == status.HTTP_200_OK
@@ -137,55 +132,58 @@ class TestDepartmentUpdate:
         assert dept["name"] == data["name"]
         assert dept["description"] == data["description"]
 
-    async def test_update_department_not_found(self, authenticated_client):
-        """Should return 404 for non-existent department."""
-        from uuid import uuid4
-
-        fake_id = uuid4()
-        data = {"name": "Updated"}
-
-        response = authenticated_client.put(f"{API_PREFIX}/departments/{fake_id}", json=data)
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
 
 class TestDepartmentDeletion:
     """Test department deletion endpoints."""
 
-    async def test_delete_department_success(self, authenticated_client, test_department):
+    async def test_delete_department_success(self, authenticated_async_client, test_department):
         """Should soft delete department successfully."""
-        response = authenticated_client.delete(f"{API_PREFIX}/departments/{test_department.id}")
+        response = await authenticated_async_client.delete(department_url(test_department.id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    async def test_delete_department_not_found(self, authenticated_client):
-        """Should return 404 for non-existent department."""
-        from uuid import uuid4
-
-        fake_id = uuid4()
-        response = authenticated_client.delete(f"{API_PREFIX}/departments/{fake_id}")
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
     async def test_delete_department_with_teams(
-        self, authenticated_client, test_department, test_team
+        self, authenticated_async_client, test_department, test_team
     ):
         """Should handle deletion of department with teams."""
         # This tests that the cascade behavior works correctly
-        response = authenticated_client.delete(f"{API_PREFIX}/departments/{test_department.id}")
+        response = await authenticated_async_client.delete(department_url(test_department.id))
 
         # Should succeed with soft delete
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+class TestDepartmentNotFound:
+    """Test endpoints addressing a non-existent department."""
+
+    @pytest.mark.parametrize(
+        ("method", "body"),
+        [
+            ("GET", None),
+            ("PUT", {"name": "Updated"}),
+            ("DELETE", None),
+        ],
+    )
+    async def test_department_not_found(self, authenticated_async_client, method, body):
+        """Should return 404 for non-existent department."""
+        response = await authenticated_async_client.request(
+            method, department_url(uuid4()), json=body
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert_problem_detail_response(
+            response.json(), "resource-not-found", status.HTTP_404_NOT_FOUND
+        )
+
+
 class TestDepartmentStatistics:
     """Test department statistics endpoints."""
 
     async def test_get_department_team_count(
-        self, authenticated_client, test_department, test_team, db_session
+        self, authenticated_async_client, test_department, test_team, db_session
     ):
         """Should return correct team count for department."""
-        response = authenticated_client.get(f"{API_PREFIX}/departments/{test_department.id}")
+        response = await authenticated_async_client.get(department_url(test_department.id))
 
         assert response.status_code == status.HTTP_200_OK
         dept = response.json()
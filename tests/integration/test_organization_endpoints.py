@@ -1,19 +1,42 @@
 """Integration tests for organization endpoints."""
 
+from uuid import UUID, uuid4
+
 import pytest
 from fastapi import status
+from sqlalchemy import insert
 
+from productivity_tracker.database.entities.organization import user_organizations
+from productivity_tracker.database.entities.user import User
 from productivity_tracker.versioning import CURRENT_VERSION
+from tests.utilities import assert_json_response
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+# All tests share one event loop instead of creating a new loop per test
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
 
 API_PREFIX = CURRENT_VERSION.api_prefix
+ORGANIZATIONS_URL = f"{API_PREFIX}/organizations"
+
+
+def organization_url(organization_id: UUID) -> str:
+    """Build the URL for a single organization."""
+    return f"{ORGANIZATIONS_URL}/{organization_id}"
+
+
+@pytest.fixture
+def organization_member(db_session, test_organization, test_user):
+    """Add the test user to the test organization and return the user."""
+    db_session.execute(
+        user_organizations.insert(),
+        [{"user_id": test_user.id, "organization_id": test_organization.id}],
+    )
+    return test_user
 
 
 class TestOrganizationCreation:
     """Test organization creation endpoints."""
 
-    async def test_create_organization_success(self, authenticated_client, test_user):
+    async def test_create_organization_success(self, authenticated_async_client, test_user):
         """Should create organization successfully."""
         data = {
             "name": "Test Organization",
@@ -21,18 +44,14 @@ class TestOrganizationCreation:
             "description": "A test organization",
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/organizations", json=data)
+        response = await authenticated_async_client.post(ORGANIZATIONS_URL, json=data)
 
-        assert response.status_code == status.HTTP_201_CREATED
-        org = response.json()
-        assert org["name"] == data["name"]
-        assert org["slug"] == data["slug"]
-        assert org["description"] == data["description"]
+        org = assert_json_response(response, status.HTTP_201_CREATED, **data)
         assert "id" in org
         assert "created_at" in org
 
     async def test_create_organization_duplicate_slug(
-        self, authenticated_client, test_organization
+        self, authenticated_async_client, test_organization
     ):
         """Should reject duplicate slug."""
         data = {
@@ -41,15 +60,15 @@ class TestOrganizationCreation:
             "description": "Another org",
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/organizations", json=data)
+        response = await authenticated_async_client.post(ORGANIZATIONS_URL, json=data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    async def test_create_organization_invalid_data(self, authenticated_client):
+    async def test_create_organization_invalid_data(self, authenticated_async_client):
         """Should reject invalid data."""
         data = {"name": ""}  # Empty name
 
-        response = authenticated_client.post(f"{API_PREFIX}/organizations", json=data)
+        response = await authenticated_async_client.post(ORGANIZATIONS_URL, json=data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -60,7 +79,7 @@ class TestOrganizationCreation:
             "slug": "test-org",
         }
 
-        response = client_integration.post(f"{API_PREFIX}/organizations", json=data)
+        response = client_integration.post(ORGANIZATIONS_URL, json=data)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -68,105 +87,80 @@ class TestOrganizationCreation:
 class TestOrganizationRetrieval:
     """Test organization retrieval endpoints."""
 
-    async def test_get_all_organizations(self, authenticated_client, test_organization):
+    async def test_get_all_organizations(self, authenticated_async_client, test_organization):
         """Should get all organizations."""
-        response = authenticated_client.get(f"{API_PREFIX}/organizations")
+        response = await authenticated_async_client.get(ORGANIZATIONS_URL)
 
-        assert response.status_code == status.HTTP_200_OK
-        orgs = response.json()
+        orgs = assert_json_response(response, status.HTTP_200_OK)
         assert isinstance(orgs, list)
         assert len(orgs) >= 1
         assert any(org["id"] == str(test_organization.id) for org in orgs)
 
-    async def test_get_organization_by_id(self, authenticated_client, test_organization):
+    async def test_get_organization_by_id(self, authenticated_async_client, test_organization):
         """Should get organization by ID."""
-        response = authenticated_client.get(f"{API_PREFIX}/organizations/{test_organization.id}")
-
-        assert response.status_code == status.HTTP_200_OK
-        org = response.json()
-        assert org["id"] == str(test_organization.id)
-        assert org["name"] == test_organization.name
-        assert org["slug"] == test_organization.slug
+        response = await authenticated_async_client.get(organization_url(test_organization.id))
+
+        assert_json_response(
+            response,
+            status.HTTP_200_OK,
+            id=str(test_organization.id),
+            name=test_organization.name,
+            slug=test_organization.slug,
+        )
 
     async def test_get_current_organization(
-        self, authenticated_client, test_organization, test_user, db_session
+        self, authenticated_async_client, test_organization, organization_member
     ):
         """Should get current user's organization."""
-        # Add user to organization
-        from productivity_tracker.database.entities.organization import (
-            user_organizations,
-        )
-
-        db_session.execute(
-            user_organizations.insert().values(
-                user_id=test_user.id, organization_id=test_organization.id
-            )
-        )
-        db_session.commit()
-
-        response = authenticated_client.get(f"{API_PREFIX}/organizations/current")
+        response = await authenticated_async_client.get(f"{ORGANIZATIONS_URL}/current")
 
-        assert response.status_code == status.HTTP_200_OK
-        org = response.json()
-        assert org["id"] == str(test_organization.id)
-
-    async def test_get_organization_not_found(self, authenticated_client):
-        """Should return 404 for non-existent organization."""
-        from uuid import uuid4
-
-        fake_id = uuid4()
-        response = authenticated_client.get(f"{API_PREFIX}/organizations/{fake_id}")
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert_json_response(response, status.HTTP_200_OK, id=str(test_organization.id))
 
 
 class TestOrganizationUpdate:
     """Test organization update endpoints."""
 
-    async def test_update_organization_success(self, authenticated_client, test_organization):
+    async def test_update_organization_success(self, authenticated_async_client, test_organization):
         """Should update organization successfully."""
         data = {
             "name": "Updated Organization",
             "description": "Updated description",
         }
 
-        response = authenticated_client.put(
-            f"{API_PREFIX}/organizations/{test_organization.id}", json=data
+        response = await authenticated_async_client.put(
+            organization_url(test_organization.id), json=data
         )
 
-        assert response.status_code == status.HTTP_200_OK
-        org = response.json()
-        assert org["name"] == data["name"]
-        assert org["description"] == data["description"]
-        assert org["slug"] == test_organization.slug  # Slug unchanged
-
-    async def test_update_organization_not_found(self, authenticated_client):
-        """Should return 404 for non-existent organization."""
-        from uuid import uuid4
-
-        fake_id = uuid4()
-        data = {"name": "Updated"}
-
-        response = authenticated_client.put(f"{API_PREFIX}/organizations/{fake_id}", json=data)
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        # Slug unchanged
+        assert_json_response(response, status.HTTP_200_OK, **data, slug=test_organization.slug)
 
 
 class TestOrganizationDeletion:
     """Test organization deletion endpoints."""
 
-    async def test_delete_organization_success(self, authenticated_client, test_organization):
+    async def test_delete_organization_success(self, authenticated_async_client, test_organization):
         """Should soft delete organization successfully."""
-        response = authenticated_client.delete(f"{API_PREFIX}/organizations/{test_organization.id}")
+        response = await authenticated_async_client.delete(organization_url(test_organization.id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    async def test_delete_organization_not_found(self, authenticated_client):
-        """Should return 404 for non-existent organization."""
-        from uuid import uuid4
 
-        fake_id = uuid4()
-        response = authenticated_client.delete(f"{API_PREFIX}/organizations/{fake_id}")
+class TestOrganizationNotFound:
+    """Test endpoints addressing a non-existent organization."""
+
+    @pytest.mark.parametrize(
+        ("method", "body"),
+        [
+            ("GET", None),
+            ("PUT", {"name": "Updated"}),
+            ("DELETE", None),
+        ],
+    )
+    async def test_organization_not_found(self, authenticated_async_client, method, body):
+        """Should return 404 for non-existent organization."""
+        response = await authenticated_async_client.request(
+            method, organization_url(uuid4()), json=body
+        )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -175,76 +169,48 @@ class TestOrganizationMembers:
     """Test organization member management endpoints."""
 
     async def test_add_member_to_organization(
-        self, authenticated_client, test_organization, db_session
+        self, authenticated_async_client, test_organization, db_session, dummy_password_hash
     ):
         """Should add member to organization."""
         # Create a user to add
-        from productivity_tracker.core.security import hash_password
-        from productivity_tracker.database.entities.user import User
-
-        new_user = User(
-            username="newmember",
-            email="newmember@example.com",
-            hashed_password=hash_password("password123"),
-            first_name="New",
-            last_name="Member",
-        )
-        db_session.add(new_user)
-        db_session.commit()
-        db_session.refresh(new_user)
+        new_user_id = db_session.execute(
+            insert(User)
+            .values(
+                username="newmember",
+                email="newmember@example.com",
+                hashed_password=dummy_password_hash,
+                first_name="New",
+                last_name="Member",
+            )
+            .returning(User.id)
+        ).scalar_one()
 
-        response = authenticated_client.post(
-            f"{API_PREFIX}/organizations/{test_organization.id}/members/{new_user.id}"
+        response = await authenticated_async_client.post(
+            f"{organization_url(test_organization.id)}/members/{new_user_id}"
         )
 
-        assert response.status_code == status.HTTP_200_OK
-        org = response.json()
-        assert org["id"] == str(test_organization.id)
+        assert_json_response(response, status.HTTP_200_OK, id=str(test_organization.id))
 
     async def test_remove_member_from_organization(
-        self, authenticated_client, test_organization, test_user, db_session
+        self, authenticated_async_client, test_organization, organization_member
     ):
         """Should remove member from organization."""
-        # Add user first
-        from productivity_tracker.database.entities.organization import (
-            user_organizations,
-        )
-
-        db_session.execute(
-            user_organizations.insert().values(
-                user_id=test_user.id, organization_id=test_organization.id
-            )
-        )
-        db_session.commit()
-
-        response = authenticated_client.delete(
-            f"{API_PREFIX}/organizations/{test_organization.id}/members/{test_user.id}"
+        response = await authenticated_async_client.delete(
+            f"{organization_url(test_organization.id)}/members/{organization_member.id}"
         )
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
     async def test_get_organization_members(
-        self, authenticated_client, test_organization, test_user, db_session
+        self, authenticated_async_client, test_organization, organization_member
     ):
         """Should get all organization members."""
-        # Add user to organization
-        from productivity_tracker.database.entities.organization import (
-            user_organizations,
-        )
-
-        db_session.execute(
-            user_organizations.insert().values(
-                user_id=test_user.id, organization_id=test_organization.id
-            )
-        )
-        db_session.commit()
-
-        response = authenticated_client.get(
-            f"{API_PREFIX}/organizations/{test_organization.id}/members"
+        response = await authenticated_async_client.get(
+            f"{organization_url(test_organization.id)}/members"
         )
 
         assert response.status_code == status.HTTP_200_OK
         members = response.json()
         assert isinstance(members, list)
         assert len(members) >= 1
-        assert any(member["id"] == str(test_user.id) for member in members)
+        assert any(member["id"] == str(organization_member.id) for member in members)
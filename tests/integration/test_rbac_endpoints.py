@@ -1,80 +1,131 @@
 """Integration tests for RBAC (Role and Permission) endpoints."""
 
+from collections.abc import Callable
+from typing import NamedTuple
+from uuid import uuid4
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy import Engine, insert
 from sqlalchemy.orm import Session
 
 from productivity_tracker.database.entities import Permission, Role, User
 from productivity_tracker.versioning.versioning import CURRENT_VERSION
 from tests.utilities import assert_problem_detail_response
 
-pytestmark = [pytest.mark.integration, pytest.mark.rbac]
+# All tests share one event loop instead of creating a new loop per test
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.rbac,
+    pytest.mark.asyncio(loop_scope="session"),
+]
 
 # Get the version prefix for all endpoints
 API_PREFIX = CURRENT_VERSION.api_prefix
 
 
-class TestRoleEndpoints:
-    """Integration tests for /api/v1.1/roles endpoints."""
+def role_payload() -> dict[str, str]:
+    """Build a unique role creation payload."""
+    return {
+        "name": f"manager_{uuid4().hex[:8]}",
+        "description": "Manager role with elevated permissions",
+    }
 
-    def test_create_role_as_superuser(
-        self, client_integration: TestClient, sample_superuser_integration: User
-    ):
-        """Test superuser can create a role."""
-        # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
 
-        # Use unique name to avoid conflicts
-        import time
+def permission_payload() -> dict[str, str]:
+    """Build a unique permission creation payload."""
+    return {
+        "name": f"tasks:create_{uuid4().hex[:8]}",
+        "description": "Create tasks",
+        "resource": "tasks",
+        "action": "create",
+    }
+
+
+class RBACResource(NamedTuple):
+    """An RBAC resource exposed through the same CRUD endpoints."""
+
+    path: str
+    model: type[Role] | type[Permission]
+    make_payload: Callable[[], dict[str, str]]
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(RBACResource("roles", Role, role_payload), id="role"),
+        pytest.param(RBACResource("permissions", Permission, permission_payload), id="permission"),
+    ],
+)
+def resource(request: pytest.FixtureRequest) -> RBACResource:
+    """Run a test once for roles and once for permissions."""
+    rbac_resource: RBACResource = request.param
+    return rbac_resource
+
+
+@pytest.fixture(scope="module")
+def seeded(engine_integration: Engine, resource: RBACResource) -> Role | Permission:
+    """Commit one role or permission per module for read-only tests."""
+    with Session(engine_integration, expire_on_commit=False) as session:
+        entity = resource.model(**resource.make_payload())
+        session.add(entity)
+        session.commit()
+        return entity
+
+
+@pytest.fixture
+def make_role(db_session_integration: Session) -> Callable[[], Role]:
+    """Return a factory that flushes a uniquely named role into the test session."""
+
+    def _make_role() -> Role:
+        role = Role(name=f"test_role_{uuid4().hex[:8]}", description="Test role")
+        db_session_integration.add(role)
+        db_session_integration.flush()
+        return role
+
+    return _make_role
 
-        unique_suffix = str(int(time.time() * 1000000))
+
+class TestRBACResourceEndpoints:
+    """Integration tests for CRUD on /api/v1.1/roles and /api/v1.1/permissions."""
+
+    @pytest.fixture
+    def existing(
+        self, db_session_integration: Session, resource: RBACResource
+    ) -> Role | Permission:
+        """Create a role or permission directly in the database."""
+        entity = resource.model(**resource.make_payload())
+        db_session_integration.add(entity)
+        db_session_integration.flush()
+        return entity
+
+    async def test_create_as_superuser(
+        self,
+        async_superuser_client: httpx.AsyncClient,
+        resource: RBACResource,
+    ):
+        """Test superuser can create a role or permission."""
+        payload = resource.make_payload()
 
         # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/roles",
-            json={
-                "name": f"manager_{unique_suffix}",
-                "description": "Manager role with elevated permissions",
-            },
-        )
+        response = await async_superuser_client.post(f"{API_PREFIX}/{resource.path}", json=payload)
 
         # Assert
         assert response.status_code == 201
         data = response.json()
-        assert data["name"] == f"manager_{unique_suffix}"
-        assert data["description"] == "Manager role with elevated permissions"
+        assert data["name"] == payload["name"]
+        assert data["description"] == payload["description"]
         assert "id" in data
 
-    def test_create_role_as_regular_user(
-        self, client_integration: TestClient, sample_user_integration: User
+    async def test_create_as_regular_user(
+        self,
+        async_regular_user_client: httpx.AsyncClient,
+        resource: RBACResource,
     ):
-        """Test regular user cannot create a role."""
-        # Arrange - Login as regular user
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
-
-        import time
-
-        unique_suffix = str(int(time.time() * 1000000))
-
+        """Test regular user cannot create a role or permission."""
         # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/roles",
-            json={
-                "name": f"manager_{unique_suffix}",
-                "description": "Manager role",
-            },
+        response = await async_regular_user_client.post(
+            f"{API_PREFIX}/{resource.path}", json=resource.make_payload()
         )
 
         # Assert
@@ -87,39 +138,17 @@ class TestRoleEndpoints:
             expected_detail_contains="permission",
         )
 
-    def test_create_role_duplicate_name(
+    async def test_create_duplicate_name(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
+        async_superuser_client: httpx.AsyncClient,
+        existing: Role | Permission,
+        resource: RBACResource,
     ):
-        """Test creating role with duplicate name fails."""
-        # Arrange - Create a role first
-        from uuid import uuid4
-
-        existing_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(existing_role)
-        db_session_integration.flush()
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
+        """Test creating a role or permission with a duplicate name fails."""
         # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/roles",
-            json={
-                "name": existing_role.name,
-                "description": "Duplicate role",
-            },
+        response = await async_superuser_client.post(
+            f"{API_PREFIX}/{resource.path}",
+            json={**resource.make_payload(), "name": existing.name},
         )
 
         # Assert
@@ -132,591 +161,186 @@ class TestRoleEndpoints:
             expected_detail_contains="already exists",
         )
 
-    def test_get_all_roles(
+    async def test_get_all(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
+        async_superuser_client: httpx.AsyncClient,
+        seeded: Role | Permission,
+        resource: RBACResource,
     ):
-        """Test getting all roles."""
-        # Arrange - Create a test role
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-        db_session_integration.flush()
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
+        """Test getting all roles or permissions."""
         # Act
-        response = client_integration.get(f"{API_PREFIX}/roles")
+        response = await async_superuser_client.get(f"{API_PREFIX}/{resource.path}")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 1
+        assert any(item["id"] == str(seeded.id) for item in data)
 
-    def test_get_role_by_id(
+    async def test_get_by_id(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
+        async_superuser_client: httpx.AsyncClient,
+        seeded: Role | Permission,
+        resource: RBACResource,
     ):
-        """Test getting role by ID."""
-        # Arrange - Create a test role
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_role)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
+        """Test getting a role or permission by ID."""
         # Act
-        response = client_integration.get(f"{API_PREFIX}/roles/{test_role.id}")
+        response = await async_superuser_client.get(f"{API_PREFIX}/{resource.path}/{seeded.id}")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == str(test_role.id)
-        assert data["name"] == test_role.name
-
-    def test_get_role_not_found(
-        self, client_integration: TestClient, sample_superuser_integration: User
-    ):
-        """Test getting non-existent role returns 404."""
-        # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.get(
-            f"{API_PREFIX}/roles/00000000-0000-0000-0000-000000000000"
-        )
-
-        # Assert
-        assert response.status_code == 404
-        data = response.json()
-        assert_problem_detail_response(
-            data,
-            expected_type="resource-not-found",
-            expected_status=404,
-            expected_detail_contains="doesn't exist",
-        )
+        assert data["id"] == str(seeded.id)
+        assert data["name"] == seeded.name
 
-    def test_update_role(
+    async def test_update(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
+        async_superuser_client: httpx.AsyncClient,
+        existing: Role | Permission,
+        resource: RBACResource,
     ):
-        """Test updating a role."""
-        # Arrange - Create a test role
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_role)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        """Test updating a role or permission."""
+        new_name = resource.make_payload()["name"]
 
         # Act
-        response = client_integration.put(
-            f"{API_PREFIX}/roles/{test_role.id}",
-            json={
-                "name": "updated_role",
-                "description": "Updated description",
-            },
+        response = await async_superuser_client.put(
+            f"{API_PREFIX}/{resource.path}/{existing.id}",
+            json={"name": new_name, "description": "Updated description"},
         )
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["name"] == "updated_role"
+        assert data["name"] == new_name
         assert data["description"] == "Updated description"
 
-    def test_delete_role(
+    async def test_delete(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test deleting a role."""
-        # Arrange - Create a test role
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_role)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.delete(f"{API_PREFIX}/roles/{test_role.id}")
-
-        # Assert
-        assert response.status_code == 204
-
-    def test_assign_permissions_to_role(
-        self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test assigning permissions to a role."""
-        # Arrange - Create test role and permissions
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-
-        test_permissions = []
-        for i in range(2):
-            perm = Permission(
-                name=f"test:perm_{uuid4().hex[:8]}",
-                description=f"Test permission {i}",
-                resource="test_resource",
-                action="read",
-            )
-            db_session_integration.add(perm)
-            test_permissions.append(perm)
-
-        db_session_integration.flush()
-        for perm in test_permissions:
-            db_session_integration.refresh(perm)
-        db_session_integration.refresh(test_role)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/roles/{test_role.id}/permissions",
-            json={
-                "permission_ids": [str(perm.id) for perm in test_permissions],
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["permissions"]) == len(test_permissions)
-
-
-class TestPermissionEndpoints:
-    """Integration tests for /api/v1.1/permissions endpoints."""
-
-    def test_create_permission_as_superuser(
-        self, client_integration: TestClient, sample_superuser_integration: User
+        async_superuser_client: httpx.AsyncClient,
+        existing: Role | Permission,
+        resource: RBACResource,
     ):
-        """Test superuser can create a permission."""
-        # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        import time
-
-        unique_suffix = str(int(time.time() * 1000000))
-
+        """Test deleting a role or permission."""
         # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/permissions",
-            json={
-                "name": f"tasks:create_{unique_suffix}",
-                "description": "Create tasks",
-                "resource": "tasks",
-                "action": "create",
-            },
+        response = await async_superuser_client.delete(
+            f"{API_PREFIX}/{resource.path}/{existing.id}"
         )
 
         # Assert
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == f"tasks:create_{unique_suffix}"
-        assert "id" in data
-
-    def test_create_permission_as_regular_user(
-        self, client_integration: TestClient, sample_user_integration: User
-    ):
-        """Test regular user cannot create a permission."""
-        # Arrange - Login as regular user
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_user_integration.username,
-                "password": "TestPassword123!",
-            },
-        )
+        assert response.status_code == 204
+        assert response.content == b""
 
-        import time
 
-        unique_suffix = str(int(time.time() * 1000000))
+class TestRoleEndpoints:
+    """Integration tests for role-specific /api/v1.1/roles endpoints."""
 
+    async def test_get_role_not_found(self, async_superuser_client: httpx.AsyncClient):
+        """Test getting non-existent role returns 404."""
         # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/permissions",
-            json={
-                "name": f"tasks:create_{unique_suffix}",
-                "description": "Create tasks",
-                "resource": "tasks",
-                "action": "create",
-            },
+        response = await async_superuser_client.get(
+            f"{API_PREFIX}/roles/00000000-0000-0000-0000-000000000000"
         )
 
         # Assert
-        assert response.status_code == 403
+        assert response.status_code == 404
         data = response.json()
         assert_problem_detail_response(
             data,
-            expected_type="permission-denied",
-            expected_status=403,
-            expected_detail_contains="permission",
+            expected_type="resource-not-found",
+            expected_status=404,
+            expected_detail_contains="doesn't exist",
         )
 
-    def test_create_permission_duplicate_name(
+    async def test_assign_permissions_to_role(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
+        async_superuser_client: httpx.AsyncClient,
         db_session_integration: Session,
+        make_role: Callable[[], Role],
     ):
-        """Test creating permission with duplicate name fails."""
-        # Arrange - Create a permission first
-        from uuid import uuid4
-
-        existing_perm = Permission(
-            name=f"test:perm_{uuid4().hex[:8]}",
-            description="Test permission",
-            resource="test",
-            action="read",
-        )
-        db_session_integration.add(existing_perm)
-        db_session_integration.flush()
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.post(
-            f"{API_PREFIX}/permissions",
-            json={
-                "name": existing_perm.name,
-                "description": "Duplicate permission",
-                "resource": "test",
+        """Test assigning permissions to a role."""
+        # Arrange - Create test role and permissions
+        test_role = make_role()
+
+        test_permissions = [
+            {
+                "id": uuid4(),
+                "name": f"test:perm_{uuid4().hex[:8]}",
+                "description": f"Test permission {i}",
+                "resource": "test_resource",
                 "action": "read",
-            },
-        )
-
-        # Assert
-        assert response.status_code == 409
-        data = response.json()
-        assert_problem_detail_response(
-            data,
-            expected_type="resource-already-exists",
-            expected_status=409,
-            expected_detail_contains="already exists",
-        )
+            }
+            for i in range(2)
+        ]
+        db_session_integration.execute(insert(Permission), test_permissions)
 
-    def test_get_all_permissions(
-        self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test getting all permissions."""
-        # Arrange - Create a test permission
-        from uuid import uuid4
-
-        test_perm = Permission(
-            name=f"test:perm_{uuid4().hex[:8]}",
-            description="Test permission",
-            resource="test",
-            action="read",
-        )
-        db_session_integration.add(test_perm)
-        db_session_integration.flush()
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
+        # Act
+        response = await async_superuser_client.post(
+            f"{API_PREFIX}/roles/{test_role.id}/permissions",
             json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
+                "permission_ids": [str(perm["id"]) for perm in test_permissions],
             },
         )
 
-        # Act
-        response = client_integration.get(f"{API_PREFIX}/permissions")
-
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
-
-    def test_get_permission_by_id(
-        self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test getting permission by ID."""
-        # Arrange - Create a test permission
-        from uuid import uuid4
-
-        test_perm = Permission(
-            name=f"test:perm_{uuid4().hex[:8]}",
-            description="Test permission",
-            resource="test",
-            action="read",
-        )
-        db_session_integration.add(test_perm)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_perm)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        assert len(data["permissions"]) == len(test_permissions)
 
-        # Act
-        response = client_integration.get(f"{API_PREFIX}/permissions/{test_perm.id}")
 
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == str(test_perm.id)
-        assert data["name"] == test_perm.name
+class TestPermissionEndpoints:
+    """Integration tests for permission-specific /api/v1.1/permissions endpoints."""
 
-    def test_get_permissions_by_resource(
+    async def test_get_permissions_by_resource(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
+        async_superuser_client: httpx.AsyncClient,
         db_session_integration: Session,
     ):
         """Test getting permissions by resource."""
         # Arrange - Create test permissions
-        from uuid import uuid4
-
         unique_resource = f"task_{uuid4().hex[:8]}"
-        test_perms = []
-        for i in range(2):
-            perm = Permission(
-                name=f"{unique_resource}:action_{i}_{uuid4().hex[:8]}",
-                description=f"Test permission {i}",
-                resource=unique_resource,
-                action=f"action_{i}",
-            )
-            db_session_integration.add(perm)
-            test_perms.append(perm)
-
-        db_session_integration.flush()
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
+        db_session_integration.execute(
+            insert(Permission),
+            [
+                {
+                    "name": f"{unique_resource}:action_{i}_{uuid4().hex[:8]}",
+                    "description": f"Test permission {i}",
+                    "resource": unique_resource,
+                    "action": f"action_{i}",
+                }
+                for i in range(2)
+            ],
         )
 
         # Act
-        response = client_integration.get(f"{API_PREFIX}/permissions/resource/{unique_resource}")
+        response = await async_superuser_client.get(
+            f"{API_PREFIX}/permissions/resource/{unique_resource}"
+        )
 
         # Assert
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
+        assert len(data) == 2
         # All permissions should be for our unique resource
         for perm in data:
             assert perm["resource"] == unique_resource
 
-    def test_update_permission(
-        self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test updating a permission."""
-        # Arrange - Create a test permission
-        from uuid import uuid4
-
-        test_perm = Permission(
-            name=f"test:perm_{uuid4().hex[:8]}",
-            description="Test permission",
-            resource="test",
-            action="read",
-        )
-        db_session_integration.add(test_perm)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_perm)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.put(
-            f"{API_PREFIX}/permissions/{test_perm.id}",
-            json={
-                "name": f"tasks:read_updated_{uuid4().hex[:8]}",
-                "description": "Updated description",
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "tasks:read_updated" in data["name"]
-        assert data["description"] == "Updated description"
-
-    def test_delete_permission(
-        self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
-        db_session_integration: Session,
-    ):
-        """Test deleting a permission."""
-        # Arrange - Create a test permission
-        from uuid import uuid4
-
-        test_perm = Permission(
-            name=f"test:perm_{uuid4().hex[:8]}",
-            description="Test permission",
-            resource="test",
-            action="delete",
-        )
-        db_session_integration.add(test_perm)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_perm)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
-        # Act
-        response = client_integration.delete(f"{API_PREFIX}/permissions/{test_perm.id}")
-
-        # Assert
-        assert response.status_code == 204
-
 
 class TestRBACIntegration:
     """Integration tests for complete RBAC flow."""
 
-    def test_assign_role_to_user(
+    async def test_assign_role_to_user(
         self,
-        client_integration: TestClient,
-        sample_superuser_integration: User,
+        async_superuser_client: httpx.AsyncClient,
         sample_user_integration: User,
-        db_session_integration: Session,
+        make_role: Callable[[], Role],
     ):
         """Test assigning a role to a user."""
         # Arrange - Create a test role
-        from uuid import uuid4
-
-        test_role = Role(
-            name=f"test_role_{uuid4().hex[:8]}",
-            description="Test role",
-        )
-        db_session_integration.add(test_role)
-        db_session_integration.flush()
-        db_session_integration.refresh(test_role)
-
-        # Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
+        test_role = make_role()
 
         # Act
-        response = client_integration.post(
+        response = await async_superuser_client.post(
             f"{API_PREFIX}/auth/users/{sample_user_integration.id}/roles",
             json={
                 "role_ids": [str(test_role.id)],
@@ -730,23 +354,14 @@ class TestRBACIntegration:
         role_names = [role["name"] for role in data["roles"]]
         assert test_role.name in role_names
 
-    def test_superuser_bypasses_permission_checks(
-        self, client_integration: TestClient, sample_superuser_integration: User
+    async def test_superuser_bypasses_permission_checks(
+        self, async_superuser_client: httpx.AsyncClient
     ):
         """Test superuser can access all endpoints."""
-        # Arrange - Login as superuser
-        client_integration.post(
-            f"{API_PREFIX}/auth/login",
-            json={
-                "username": sample_superuser_integration.username,
-                "password": "AdminPassword123!",
-            },
-        )
-
         # Act - Access admin endpoints
-        users_response = client_integration.get(f"{API_PREFIX}/auth/users")
-        roles_response = client_integration.get(f"{API_PREFIX}/roles")
-        permissions_response = client_integration.get(f"{API_PREFIX}/permissions")
+        users_response = await async_superuser_client.get(f"{API_PREFIX}/auth/users")
+        roles_response = await async_superuser_client.get(f"{API_PREFIX}/roles")
+        permissions_response = await async_superuser_client.get(f"{API_PREFIX}/permissions")
 
         # Assert
         assert users_response.status_code == 200
@@ -1,20 +1,37 @@
 """Integration tests for team endpoints."""
 
+from uuid import UUID, uuid4
+
 import pytest
 from fastapi import status
 
+from productivity_tracker.database.entities.team import user_teams
 from productivity_tracker.versioning import CURRENT_VERSION
 from tests.utilities import assert_problem_detail_response
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+# All tests share one event loop instead of creating a new loop per test
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
 
 API_PREFIX = CURRENT_VERSION.api_prefix
+TEAMS_URL = f"{API_PREFIX}/teams"
+
+
+def team_url(team_id: UUID) -> str:
+    """Build the URL for a single team."""
+    return f"{TEAMS_URL}/{team_id}"
+
+
+@pytest.fixture
+def team_member(db_session, test_team, test_user):
+    """Add the test user to the test team and return the user."""
+    db_session.execute(user_teams.insert(), [{"user_id": test_user.id, "team_id": test_team.id}])
+    return test_user
 
 
 class TestTeamCreation:
     """Test team creation endpoints."""
 
-    async def test_create_team_success(self, authenticated_client, test_department):
+    async def test_create_team_success(self, authenticated_async_client, test_department):
         """Should create team successfully."""
         data = {
             "name": "Backend Team",
@@ -22,7 +39,7 @@ class TestTeamCreation:
             "description": "Backend development team",
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams", json=data)
+        response = await authenticated_async_client.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_201_CREATED
         team = response.json()
@@ -32,7 +49,9 @@ class TestTeamCreation:
         assert "id" in team
         assert "created_at" in team
 
-    async def test_create_team_with_lead(self, authenticated_client, test_department, test_user):
+    async def test_create_team_with_lead(
+        self, authenticated_async_client, test_department, test_user
+    ):
         """Should create team with lead."""
         data = {
             "name": "Frontend Team",
@@ -40,48 +59,44 @@ class TestTeamCreation:
             "lead_id": str(test_user.id),
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams", json=data)
+        response = await authenticated_async_client.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_201_CREATED
         team = response.json()
         assert team["name"] == data["name"]
         assert team["lead_id"] == data["lead_id"]
 
-    async def test_create_team_invalid_department(self, authenticated_client):
+    async def test_create_team_invalid_department(self, authenticated_async_client):
         """Should reject invalid department ID."""
-        from uuid import uuid4
-
         data = {
             "name": "Test Team",
             "department_id": str(uuid4()),
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams", json=data)
+        response = await authenticated_async_client.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert_problem_detail_response(
             response.json(), "resource-not-found", status.HTTP_404_NOT_FOUND
         )
 
-    async def test_create_team_invalid_lead(self, authenticated_client, test_department):
+    async def test_create_team_invalid_lead(self, authenticated_async_client, test_department):
         """Should reject invalid lead ID."""
-        from uuid import uuid4
-
         data = {
             "name": "Test Team",
             "department_id": str(test_department.id),
             "lead_id": str(uuid4()),
         }
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams", json=data)
+        response = await authenticated_async_client.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    async def test_create_team_missing_required_fields(self, authenticated_client):
+    async def test_create_team_missing_required_fields(self, authenticated_async_client):
         """Should reject missing required fields."""
         data = {"name": ""}  # Empty name
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams", json=data)
+        response = await authenticated_async_client.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -92,7 +107,7 @@ class TestTeamCreation:
             "department_id": str(test_department.id),
         }
 
-        response = client_integration.post(f"{API_PREFIX}/teams", json=data)
+        response = client_integration.post(TEAMS_URL, json=data)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -100,9 +115,9 @@ class TestTeamCreation:
 class TestTeamRetrieval:
     """Test team retrieval endpoints."""
 
-    async def test_get_all_teams(self, authenticated_client, test_team):
+    async def test_get_all_teams(self, authenticated_async_client, test_team):
         """Should get all teams."""
-        response = authenticated_client.get(f"{API_PREFIX}/teams")
+        response = await authenticated_async_client.get(TEAMS_URL)
 
         assert response.status_code == status.HTTP_200_OK
         teams = response.json()
@@ -110,9 +125,9 @@ class TestTeamRetrieval:
         assert len(teams) >= 1
         assert any(team["id"] == str(test_team.id) for team in teams)
 
-    async def test_get_team_by_id(self, authenticated_client, test_team):
+    async def test_get_team_by_id(self, authenticated_async_client, test_team):
         """Should get team by ID."""
-        response = authenticated_client.get(f"{API_PREFIX}/teams/{test_team.id}")
+        response = await authenticated_async_client.get(team_url(test_team.id))
 
         assert response.status_code == status.HTTP_200_OK
         team = response.json()
@@ -120,9 +135,13 @@ class TestTeamRetrieval:
         assert team["name"] == test_team.name
         assert team["department_id"] == str(test_team.department_id)
 
-    async def test_get_teams_by_department(self, authenticated_client, test_department, test_team):
+    async def test_get_teams_by_department(
+        self, authenticated_async_client, test_department, test_team
+    ):
         """Should get teams by department."""
-        response = authenticated_client.get(f"/api/v1.1/departments/{test_department.id}/teams")
+        response = await authenticated_async_client.get(
+            f"{API_PREFIX}/departments/{test_department.id}/teams"
+        )
 
         assert response.status_code == status.HTTP_200_OK
         teams = response.json()
@@ -130,12 +149,10 @@ class TestTeamRetrieval:
         assert len(teams) >= 1
         assert all(team["department_id"] == str(test_department.id) for team in teams)
 
-    async def test_get_team_not_found(self, authenticated_client):
+    async def test_get_team_not_found(self, authenticated_async_client):
         """Should return 404 for non-existent team."""
-        from uuid import uuid4
-
         fake_id = uuid4()
-        response = authenticated_client.get(f"{API_PREFIX}/teams/{fake_id}")
+        response = await authenticated_async_client.get(team_url(fake_id))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert_problem_detail_response(
@@ -146,38 +163,36 @@ class TestTeamRetrieval:
 class TestTeamUpdate:
     """Test team update endpoints."""
 
-    async def test_update_team_success(self, authenticated_client, test_team):
+    async def test_update_team_success(self, authenticated_async_client, test_team):
         """Should update team successfully."""
         data = {
             "name": "Updated Team",
             "description": "Updated description",
         }
 
-        response = authenticated_client.put(f"{API_PREFIX}/teams/{test_team.id}", json=data)
+        response = await authenticated_async_client.put(team_url(test_team.id), json=data)
 
         assert response.status_code == status.HTTP_200_OK
         team = response.json()
         assert team["name"] == data["name"]
         assert team["description"] == data["description"]
 
-    async def test_update_team_lead(self, authenticated_client, test_team, test_user):
+    async def test_update_team_lead(self, authenticated_async_client, test_team, test_user):
         """Should update team lead."""
         data = {"lead_id": str(test_user.id)}
 
-        response = authenticated_client.put(f"{API_PREFIX}/teams/{test_team.id}", json=data)
+        response = await authenticated_async_client.put(team_url(test_team.id), json=data)
 
         assert response.status_code == status.HTTP_200_OK
         team = response.json()
         assert team["lead_id"] == data["lead_id"]
 
-    async def test_update_team_not_found(self, authenticated_client):
+    async def test_update_team_not_found(self, authenticated_async_client):
         """Should return 404 for non-existent team."""
-        from uuid import uuid4
-
         fake_id = uuid4()
         data = {"name": "Updated"}
 
-        response = authenticated_client.put(f"{API_PREFIX}/teams/{fake_id}", json=data)
+        response = await authenticated_async_client.put(team_url(fake_id), json=data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -185,18 +200,16 @@ class TestTeamUpdate:
 class TestTeamDeletion:
     """Test team deletion endpoints."""
 
-    async def test_delete_team_success(self, authenticated_client, test_team):
+    async def test_delete_team_success(self, authenticated_async_client, test_team):
         """Should soft delete team successfully."""
-        response = authenticated_client.delete(f"{API_PREFIX}/teams/{test_team.id}")
+        response = await authenticated_async_client.delete(team_url(test_team.id))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    async def test_delete_team_not_found(self, authenticated_client):
+    async def test_delete_team_not_found(self, authenticated_async_client):
         """Should return 404 for non-existent team."""
-        from uuid import uuid4
-
         fake_id = uuid4()
-        response = authenticated_client.delete(f"{API_PREFIX}/teams/{fake_id}")
+        response = await authenticated_async_client.delete(team_url(fake_id))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -204,88 +217,64 @@ class TestTeamDeletion:
 class TestTeamMembers:
     """Test team member management endpoints."""
 
-    async def test_add_member_to_team(self, authenticated_client, test_team, test_user):
+    async def test_add_member_to_team(self, authenticated_async_client, test_team, test_user):
         """Should add member to team."""
         data = {"user_id": str(test_user.id)}
 
-        response = authenticated_client.post(
-            f"{API_PREFIX}/teams/{test_team.id}/members", json=data
+        response = await authenticated_async_client.post(
+            f"{team_url(test_team.id)}/members", json=data
         )
 
         assert response.status_code == status.HTTP_200_OK
         team = response.json()
         assert team["id"] == str(test_team.id)
 
-    async def test_add_member_invalid_user(self, authenticated_client, test_team):
+    async def test_add_member_invalid_user(self, authenticated_async_client, test_team):
         """Should reject invalid user ID."""
-        from uuid import uuid4
-
         data = {"user_id": str(uuid4())}
 
-        response = authenticated_client.post(
-            f"{API_PREFIX}/teams/{test_team.id}/members", json=data
+        response = await authenticated_async_client.post(
+            f"{team_url(test_team.id)}/members", json=data
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    async def test_add_member_to_invalid_team(self, authenticated_client, test_user):
+    async def test_add_member_to_invalid_team(self, authenticated_async_client, test_user):
         """Should reject invalid team ID."""
-        from uuid import uuid4
-
         fake_id = uuid4()
         data = {"user_id": str(test_user.id)}
 
-        response = authenticated_client.post(f"{API_PREFIX}/teams/{fake_id}/members", json=data)
+        response = await authenticated_async_client.post(f"{team_url(fake_id)}/members", json=data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     async def test_remove_member_from_team(
-        self, authenticated_client, test_team, test_user, db_session
+        self, authenticated_async_client, test_team, team_member
     ):
         """Should remove member from team."""
-        # Add user first
-        from productivity_tracker.database.entities.team import user_teams
-
-        db_session.execute(user_teams.insert().values(user_id=test_user.id, team_id=test_team.id))
-        db_session.commit()
-
-        response = authenticated_client.delete(
-            f"{API_PREFIX}/teams/{test_team.id}/members/{test_user.id}"
+        response = await authenticated_async_client.delete(
+            f"{team_url(test_team.id)}/members/{team_member.id}"
         )
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    async def test_get_team_members(self, authenticated_client, test_team, test_user, db_session):
+    async def test_get_team_members(self, authenticated_async_client, test_team, team_member):
         """Should get all team members."""
-        # Add user to team
-        from productivity_tracker.database.entities.team import user_teams
-
-        db_session.execute(user_teams.insert().values(user_id=test_user.id, team_id=test_team.id))
-        db_session.commit()
-
-        response = authenticated_client.get(f"{API_PREFIX}/teams/{test_team.id}/members")
+        response = await authenticated_async_client.get(f"{team_url(test_team.id)}/members")
 
         assert response.status_code == status.HTTP_200_OK
         members = response.json()
         assert isinstance(members, list)
         assert len(members) >= 1
-        assert any(member["id"] == str(test_user.id) for member in members)
+        assert any(member["id"] == str(team_member.id) for member in members)
 
-    async def test_add_duplicate_member(
-        self, authenticated_client, test_team, test_user, db_session
-    ):
+    async def test_add_duplicate_member(self, authenticated_async_client, test_team, team_member):
         """Should handle adding duplicate member gracefully."""
-        # Add user first time
-        from productivity_tracker.database.entities.team import user_teams
-
-        db_session.execute(user_teams.insert().values(user_id=test_user.id, team_id=test_team.id))
-        db_session.commit()
-
-        # Try to add again
-        data = {"user_id": str(test_user.id)}
+        # Try to add the existing member again
+        data = {"user_id": str(team_member.id)}
 
-        response = authenticated_client.post(
-            f"{API_PREFIX}/teams/{test_team.id}/members", json=data
+        response = await authenticated_async_client.post(
+            f"{team_url(test_team.id)}/members", json=data
         )
 
         # Should succeed (idempotent) or return appropriate status
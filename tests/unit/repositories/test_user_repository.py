@@ -3,8 +3,8 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import inspect
 
-from productivity_tracker.core.security import hash_password
 from productivity_tracker.database.entities.role import Role
 from productivity_tracker.database.entities.user import User
 from productivity_tracker.repositories.user_repository import UserRepository
@@ -15,13 +15,13 @@ pytestmark = [pytest.mark.unit]
 class TestUserRepository:
     """Test user repository methods."""
 
-    def test_get_by_username(self, db_session_unit):
+    def test_get_by_username(self, db_session_unit, dummy_password_hash):
         """Should get user by username."""
         repo = UserRepository(db_session_unit)
 
         # Create user
         user = User(
-            username="testuser", email="test@example.com", hashed_password=hash_password("password")
+            username="testuser", email="test@example.com", hashed_password=dummy_password_hash
         )
         created_user = repo.create(user)
 
@@ -40,7 +40,21 @@ class TestUserRepository:
 
         assert result is None
 
-    def test_get_by_email(self, db_session_unit):
+    @pytest.mark.parametrize("with_password", [False, True])
+    def test_get_by_id_password_loading(self, db_session_unit, dummy_password_hash, with_password):
+        """Should load the deferred password hash only when requested."""
+        repo = UserRepository(db_session_unit)
+        created_user = repo.create(
+            User(username="testuser", email="test@example.com", hashed_password=dummy_password_hash)
+        )
+        db_session_unit.expire_all()
+
+        retrieved = repo.get_by_id(created_user.id, with_password=with_password)
+
+        assert retrieved is not None
+        assert ("hashed_password" in inspect(retrieved).unloaded) is not with_password
+
+    def test_get_by_email(self, db_session_unit, dummy_password_hash):
         """Should get user by email."""
         repo = UserRepository(db_session_unit)
 
@@ -48,7 +62,7 @@ class TestUserRepository:
         user = User(
             username="emailuser",
             email="email@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         created_user = repo.create(user)
 
@@ -67,7 +81,7 @@ class TestUserRepository:
 
         assert result is None
 
-    def test_get_by_email_or_username_by_email(self, db_session_unit):
+    def test_get_by_email_or_username_by_email(self, db_session_unit, dummy_password_hash):
         """Should get user by email when searching by email or username."""
         repo = UserRepository(db_session_unit)
 
@@ -76,7 +90,7 @@ class TestUserRepository:
         user = User(
             username=f"user1_{unique}",
             email=f"user1_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         created_user = repo.create(user)
 
@@ -86,7 +100,7 @@ class TestUserRepository:
         assert retrieved is not None
         assert retrieved.id == created_user.id
 
-    def test_get_by_email_or_username_by_username(self, db_session_unit):
+    def test_get_by_email_or_username_by_username(self, db_session_unit, dummy_password_hash):
         """Should get user by username when searching by email or username."""
         repo = UserRepository(db_session_unit)
 
@@ -95,7 +109,7 @@ class TestUserRepository:
         user = User(
             username=f"user2_{unique}",
             email=f"user2_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         created_user = repo.create(user)
 
@@ -105,7 +119,7 @@ class TestUserRepository:
         assert retrieved is not None
         assert retrieved.id == created_user.id
 
-    def test_get_active_users(self, db_session_unit):
+    def test_get_active_users(self, db_session_unit, dummy_password_hash):
         """Should get all active users."""
         repo = UserRepository(db_session_unit)
 
@@ -114,13 +128,13 @@ class TestUserRepository:
         active_user = User(
             username=f"active_{unique}",
             email=f"active_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
             is_active=True,
         )
         inactive_user = User(
             username=f"inactive_{unique}",
             email=f"inactive_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
             is_active=False,
         )
         repo.create(active_user)
@@ -133,7 +147,7 @@ class TestUserRepository:
         assert f"active_{unique}" in usernames
         assert f"inactive_{unique}" not in usernames
 
-    def test_get_superusers(self, db_session_unit):
+    def test_get_superusers(self, db_session_unit, dummy_password_hash):
         """Should get all superusers."""
         repo = UserRepository(db_session_unit)
 
@@ -141,13 +155,13 @@ class TestUserRepository:
         regular_user = User(
             username="regular",
             email="regular@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
             is_superuser=False,
         )
         super_user = User(
             username="superuser",
             email="super@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
             is_superuser=True,
         )
         repo.create(regular_user)
@@ -160,13 +174,13 @@ class TestUserRepository:
         assert "superuser" in usernames
         assert "regular" not in usernames
 
-    def test_assign_roles(self, db_session_unit):
+    def test_assign_roles(self, db_session_unit, dummy_password_hash):
         """Should assign multiple roles to user."""
         repo = UserRepository(db_session_unit)
 
         # Create user
         user = User(
-            username="roleuser", email="role@example.com", hashed_password=hash_password("password")
+            username="roleuser", email="role@example.com", hashed_password=dummy_password_hash
         )
         created_user = repo.create(user)
 
@@ -187,7 +201,7 @@ class TestUserRepository:
         assert "role1" in role_names
         assert "role2" in role_names
 
-    def test_add_role(self, db_session_unit):
+    def test_add_role(self, db_session_unit, dummy_password_hash):
         """Should add single role to user."""
         repo = UserRepository(db_session_unit)
 
@@ -195,7 +209,7 @@ class TestUserRepository:
         user = User(
             username="addroleuser",
             email="addrole@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         created_user = repo.create(user)
 
@@ -211,14 +225,14 @@ class TestUserRepository:
         assert len(updated_user.roles) == 1
         assert updated_user.roles[0].name == "newrole"
 
-    def test_add_role_already_exists(self, db_session_unit):
+    def test_add_role_already_exists(self, db_session_unit, dummy_password_hash):
         """Should not duplicate role if already exists."""
         repo = UserRepository(db_session_unit)
 
         # Create user with role
         role = Role(name="existing", description="Existing Role")
         user = User(
-            username="dupuser", email="dup@example.com", hashed_password=hash_password("password")
+            username="dupuser", email="dup@example.com", hashed_password=dummy_password_hash
         )
         user.roles.append(role)
         created_user = repo.create(user)
@@ -228,7 +242,7 @@ class TestUserRepository:
 
         assert len(updated_user.roles) == 1
 
-    def test_remove_role(self, db_session_unit):
+    def test_remove_role(self, db_session_unit, dummy_password_hash):
         """Should remove role from user."""
         repo = UserRepository(db_session_unit)
 
@@ -238,7 +252,7 @@ class TestUserRepository:
         user = User(
             username="removeuser",
             email="remove@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         user.roles.extend([role1, role2])
         created_user = repo.create(user)
@@ -249,7 +263,7 @@ class TestUserRepository:
         assert len(updated_user.roles) == 1
         assert updated_user.roles[0].name == "keep"
 
-    def test_remove_role_not_in_user(self, db_session_unit):
+    def test_remove_role_not_in_user(self, db_session_unit, dummy_password_hash):
         """Should handle removing role not assigned to user."""
         repo = UserRepository(db_session_unit)
 
@@ -257,7 +271,7 @@ class TestUserRepository:
         user = User(
             username="noroleuser",
             email="norole@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         created_user = repo.create(user)
 
@@ -272,7 +286,7 @@ class TestUserRepository:
 
         assert len(updated_user.roles) == 0
 
-    def test_get_users_by_role(self, db_session_unit):
+    def test_get_users_by_role(self, db_session_unit, dummy_password_hash):
         """Should get users by role name."""
         repo = UserRepository(db_session_unit)
 
@@ -287,14 +301,14 @@ class TestUserRepository:
         admin_user = User(
             username=f"admin1_{unique}",
             email=f"admin1_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         admin_user.roles.append(admin_role)
 
         regular_user = User(
             username=f"regular1_{unique}",
             email=f"regular1_{unique}@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
 
         repo.create(admin_user)
@@ -308,7 +322,7 @@ class TestUserRepository:
         assert f"admin1_{unique}" in usernames
         assert f"regular1_{unique}" not in usernames
 
-    def test_search_users_by_username(self, db_session_unit):
+    def test_search_users_by_username(self, db_session_unit, dummy_password_hash):
         """Should search users by username."""
         repo = UserRepository(db_session_unit)
 
@@ -316,15 +330,15 @@ class TestUserRepository:
         user1 = User(
             username="searchable_john",
             email="john@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         user2 = User(
             username="searchable_jane",
             email="jane@example.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         user3 = User(
-            username="other", email="other@example.com", hashed_password=hash_password("password")
+            username="other", email="other@example.com", hashed_password=dummy_password_hash
         )
         repo.create(user1)
         repo.create(user2)
@@ -338,7 +352,7 @@ class TestUserRepository:
         assert "searchable_jane" in usernames
         assert "other" not in usernames
 
-    def test_search_users_by_email(self, db_session_unit):
+    def test_search_users_by_email(self, db_session_unit, dummy_password_hash):
         """Should search users by email."""
         repo = UserRepository(db_session_unit)
 
@@ -347,12 +361,12 @@ class TestUserRepository:
         user1 = User(
             username=f"searchuser1_{unique}",
             email=f"search{unique}@company.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         user2 = User(
             username=f"otheruser2_{unique}",
             email=f"other{unique}@different.com",
-            hashed_password=hash_password("password"),
+            hashed_password=dummy_password_hash,
         )
         repo.create(user1)
         repo.create(user2)
@@ -0,0 +1,38 @@
+"""Unit tests for authentication dependencies."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from productivity_tracker.core.dependencies import get_current_user
+from productivity_tracker.core.exceptions import InvalidTokenError
+from productivity_tracker.core.security import create_refresh_token
+
+pytestmark = [pytest.mark.unit, pytest.mark.auth, pytest.mark.asyncio(loop_scope="session")]
+
+
+class TestGetCurrentUser:
+    """Test the get_current_user dependency without going through the app."""
+
+    async def test_missing_token(self):
+        """Should reject a request without an access token cookie."""
+        db = MagicMock(spec=Session)
+
+        with pytest.raises(InvalidTokenError) as exc_info:
+            await get_current_user(access_token=None, db=db)
+
+        assert exc_info.value.status_code == 401
+        db.query.assert_not_called()
+
+    async def test_invalid_token(self):
+        """Should reject a token that fails verification."""
+        with pytest.raises(InvalidTokenError):
+            await get_current_user(access_token="invalid_token", db=MagicMock(spec=Session))
+
+    async def test_refresh_token_rejected(self):
+        """Should reject a refresh token used as an access token."""
+        token = create_refresh_token(data={"sub": "user-id"})
+
+        with pytest.raises(InvalidTokenError):
+            await get_current_user(access_token=token, db=MagicMock(spec=Session))
@@ -0,0 +1,328 @@
+import json
+import time
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from redis import Redis
+
+from productivity_tracker.core.redis_client import (
+    RedisClient,
+    get_connection_pool,
+    reset_connection_pools,
+)
+from productivity_tracker.core.settings import settings
+
+pytestmark = [pytest.mark.unit, pytest.mark.auth]
+
+# Attribute names of the Redis client, computed once. Passing a list as the mock spec
+# keeps unknown attributes rejected without re-inspecting the class for every mock.
+REDIS_SPEC = dir(Redis)
+
+USER_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def seed_sessions(client: RedisClient, user_id: UUID, session_ids: list[str]) -> None:
+    """Write sessions in the layout create_session uses, in a single pipeline."""
+    assert client._client is not None
+    payload = json.dumps({"user_id": str(user_id), "metadata": {}})
+    pipe = client._client.pipeline(transaction=False)
+    for session_id in session_ids:
+        pipe.set(f"session:{session_id}", payload, ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    pipe.sadd(f"user_sessions:{user_id}", *session_ids)
+    pipe.execute()
+
+
+@pytest.fixture
+def mock_redis(mocker):
+    """Mock Redis client."""
+    return mocker.MagicMock(spec=REDIS_SPEC)
+
+
+@pytest.fixture
+def mock_redis_cls(mocker, mock_redis):
+    """Patch the Redis class used by RedisClient to return the mocked client."""
+    return mocker.patch("productivity_tracker.core.redis_client.Redis", return_value=mock_redis)
+
+
+@pytest.fixture(autouse=True)
+def fresh_connection_pools():
+    """Give every test its own shared pool so results don't depend on test order."""
+    reset_connection_pools()
+    yield
+    reset_connection_pools()
+
+
+@pytest.fixture
+def redis_client_with_mock(mock_redis_cls, mock_redis):
+    """Create RedisClient with mocked Redis connection."""
+    return RedisClient(), mock_redis
+
+
+@pytest.fixture
+def disconnected_client(mocker):
+    """Create RedisClient whose connection attempt failed."""
+    mocker.patch(
+        "productivity_tracker.core.redis_client.Redis",
+        side_effect=Exception("Connection failed"),
+    )
+    return RedisClient()
+
+
+class TestRedisClientConnection:
+    """Tests for Redis connection management."""
+
+    def test_connect_success(self, mock_redis_cls, mock_redis):
+        """Test successful Redis connection."""
+        client = RedisClient()
+        assert client.is_connected is True
+        mock_redis_cls.assert_called_once_with(
+            connection_pool=get_connection_pool(settings.REDIS_URL)
+        )
+        mock_redis.ping.assert_called_once()
+
+    def test_clients_share_connection_pool(self, mock_redis_cls):
+        """Test that every client connects through the same pool."""
+        RedisClient()
+        RedisClient()
+        pools = [call.kwargs["connection_pool"] for call in mock_redis_cls.call_args_list]
+        assert pools[0] is pools[1]
+        assert pools[0].max_connections == settings.REDIS_POOL_SIZE
+
+    def test_connection_pool_is_per_url(self):
+        """Test that a different URL gets its own pool."""
+        pool = get_connection_pool("redis://localhost:6379/0")
+
+        assert get_connection_pool("redis://localhost:6379/0") is pool
+        assert get_connection_pool("redis://localhost:6379/1") is not pool
+
+    def test_connect_failure(self, mock_redis_cls, mock_redis):
+        """Test failed Redis connection."""
+        mock_redis.ping.side_effect = Exception("Connection failed")
+        client = RedisClient()
+        assert client.is_connected is False
+
+    @pytest.mark.parametrize(
+        ("method", "args", "expected"),
+        [
+            ("create_session", ("session_id", USER_ID), False),
+            ("get_session", ("session_id",), None),
+            ("delete_session", ("session_id",), False),
+            ("delete_sessions", (["session_id"],), 0),
+            ("delete_user_sessions", (USER_ID,), 0),
+            ("get_user_sessions_count", (USER_ID,), 0),
+            ("extend_session", ("session_id", 3600), False),
+        ],
+    )
+    def test_operations_when_not_connected(self, disconnected_client, method, args, expected):
+        """Test that every session operation fails softly when not connected."""
+        result = getattr(disconnected_client, method)(*args)
+        assert result == expected
+
+    def test_no_redis_url_configured(self, mocker):
+        """Test behavior when Redis URL is not configured."""
+        mocker.patch.object(settings, "REDIS_URL", None)
+        client = RedisClient()
+        assert client.is_connected is False
+
+    def test_close_connection(self, redis_client_with_mock):
+        """Test closing Redis connection."""
+        client, mock_redis = redis_client_with_mock
+        pool = get_connection_pool(settings.REDIS_URL)
+        client.close()
+        mock_redis.close.assert_called_once()
+        assert client.is_connected is False
+        # The shared pool outlives a single client; only app shutdown resets it
+        assert get_connection_pool(settings.REDIS_URL) is pool
+
+
+class TestSessionCreation:
+    """Tests for session creation."""
+
+    def test_create_session_success(self, fake_redis):
+        """Test successful session creation."""
+        session_id = "test_session_123"
+        user_id = USER_ID
+        metadata = {"ip": "192.168.1.1"}
+
+        result = fake_redis.create_session(session_id, user_id, metadata)
+
+        assert result is True
+        assert fake_redis.get_session(session_id) == {
+            "user_id": str(user_id),
+            "metadata": metadata,
+        }
+        assert fake_redis._client.sismember(f"user_sessions:{user_id}", session_id)
+
+    def test_create_session_with_custom_ttl(self, fake_redis):
+        """Test session creation with custom TTL."""
+        session_id = "test_session_456"
+        user_id = USER_ID
+        ttl_seconds = 7200
+
+        fake_redis.create_session(session_id, user_id, ttl_seconds=ttl_seconds)
+
+        assert 0 < fake_redis._client.ttl(f"session:{session_id}") <= ttl_seconds
+
+    def test_create_session_exception_handling(self, redis_client_with_mock):
+        """Test exception handling during session creation."""
+        client, mock_redis = redis_client_with_mock
+        mock_redis.pipeline.side_effect = Exception("Pipeline error")
+
+        result = client.create_session("session_id", USER_ID)
+        assert result is False
+
+
+class TestSessionRetrieval:
+    """Tests for session retrieval."""
+
+    def test_get_session_success(self, fake_redis):
+        """Test successful session retrieval."""
+        session_id = "test_session_123"
+        session_data = {"user_id": str(USER_ID), "metadata": {}}
+
+        fake_redis._client.set(f"session:{session_id}", json.dumps(session_data))
+
+        result = fake_redis.get_session(session_id)
+
+        assert result == session_data
+
+    def test_get_session_not_found(self, fake_redis):
+        """Test session retrieval when session doesn't exist."""
+        result = fake_redis.get_session("nonexistent_session")
+
+        assert result is None
+
+    def test_get_session_exception_handling(self, redis_client_with_mock):
+        """Test exception handling during session retrieval."""
+        client, mock_redis = redis_client_with_mock
+        mock_redis.get.side_effect = Exception("Redis error")
+
+        result = client.get_session("session_id")
+        assert result is None
+
+
+class TestSessionDeletion:
+    """Tests for session deletion."""
+
+    def test_delete_session_success(self, fake_redis):
+        """Test successful session deletion."""
+        session_id = "test_session_123"
+        user_id = USER_ID
+        fake_redis.create_session(session_id, user_id)
+
+        result = fake_redis.delete_session(session_id)
+
+        assert result is True
+        assert not fake_redis._client.exists(f"session:{session_id}")
+        assert fake_redis.get_user_sessions_count(user_id) == 0
+
+    def test_delete_session_not_found(self, fake_redis):
+        """Test deletion of non-existent session."""
+        result = fake_redis.delete_session("nonexistent_session")
+
+        assert result is True
+
+    def test_delete_session_exception_handling(self, redis_client_with_mock):
+        """Test exception handling during session deletion."""
+        client, mock_redis = redis_client_with_mock
+        mock_redis.get.side_effect = Exception("Redis error")
+
+        result = client.delete_session("session_id")
+        assert result is False
+
+    def test_delete_sessions_uses_single_pipeline(self, redis_client_with_mock):
+        """Test bulk session deletion sends all removals in one pipeline."""
+        client, mock_redis = redis_client_with_mock
+        session_ids = [f"session_{i}" for i in range(3)]
+        mock_redis.mget.return_value = [
+            json.dumps({"user_id": str(USER_ID), "metadata": {}}) for _ in session_ids
+        ]
+        mock_pipe = MagicMock()
+        mock_pipe.execute.return_value = [3, 1, 1, 1]
+        mock_redis.pipeline.return_value = mock_pipe
+
+        result = client.delete_sessions(session_ids)
+
+        assert result == 3
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipe.unlink.assert_called_once_with(*[f"session:{sid}" for sid in session_ids])
+        assert mock_pipe.srem.call_count == 3
+        mock_pipe.execute.assert_called_once()
+
+    def test_delete_sessions_removes_all_sessions(self, fake_redis):
+        """Test bulk session deletion clears session keys and user session sets."""
+        user_id = USER_ID
+        session_ids = [f"session_{i}" for i in range(100)]
+        seed_sessions(fake_redis, user_id, session_ids)
+
+        result = fake_redis.delete_sessions(session_ids)
+
+        assert result == 100
+        assert fake_redis._client.keys("session:*") == []
+        assert fake_redis.get_user_sessions_count(user_id) == 0
+
+
+class TestUserSessionManagement:
+    """Tests for user session management."""
+
+    def test_delete_user_sessions_success(self, fake_redis):
+        """Test successful deletion of all user sessions."""
+        user_id = USER_ID
+        seed_sessions(fake_redis, user_id, ["session_1", "session_2", "session_3"])
+
+        result = fake_redis.delete_user_sessions(user_id)
+
+        assert result == 3
+        assert fake_redis._client.keys("session:*") == []
+        assert not fake_redis._client.exists(f"user_sessions:{user_id}")
+
+    def test_delete_user_sessions_no_sessions(self, fake_redis):
+        """Test deletion when user has no sessions."""
+        user_id = USER_ID
+
+        result = fake_redis.delete_user_sessions(user_id)
+
+        assert result == 0
+
+    def test_get_user_sessions_count(self, fake_redis):
+        """Test getting user sessions count."""
+        user_id = USER_ID
+        seed_sessions(fake_redis, user_id, [f"session_{i}" for i in range(5)])
+
+        result = fake_redis.get_user_sessions_count(user_id)
+
+        assert result == 5
+
+
+class TestSessionExtension:
+    """Tests for session TTL extension."""
+
+    def test_extend_session_success(self, fake_redis):
+        """Test successful session TTL extension."""
+        session_id = "test_session_123"
+        ttl_seconds = 3600
+        fake_redis.create_session(session_id, USER_ID, ttl_seconds=60)
+
+        result = fake_redis.extend_session(session_id, ttl_seconds)
+
+        assert result is True
+        assert 60 < fake_redis._client.ttl(f"session:{session_id}") <= ttl_seconds
+
+    def test_session_expires_after_ttl(self, fake_redis, monkeypatch):
+        """Test that a session is gone once its TTL has elapsed."""
+        fake_redis.create_session("test_session_123", USER_ID, ttl_seconds=60)
+        now = time.time()
+
+        # fakeredis evaluates expiry against time.time(), so skip ahead instead of sleeping
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+
+        assert fake_redis.get_session("test_session_123") is None
+
+    def test_extend_session_exception_handling(self, redis_client_with_mock):
+        """Test exception handling during session extension."""
+        client, mock_redis = redis_client_with_mock
+        mock_redis.expire.side_effect = Exception("Redis error")
+
+        result = client.extend_session("session_id", 3600)
+        assert result is False
@@ -0,0 +1,70 @@
+"""Unit tests for JWT token helpers."""
+
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from productivity_tracker.core.security import (
+    _decode_verified,
+    create_access_token,
+    decode_token,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.auth]
+
+
+@pytest.fixture(autouse=True)
+def clear_decode_cache():
+    """Start every test with an empty token cache."""
+    _decode_verified.cache_clear()
+    yield
+    _decode_verified.cache_clear()
+
+
+class TestDecodeToken:
+    """Test decode_token."""
+
+    def test_decode_token_cache_hit(self, mocker):
+        """Test that decoding the same token twice verifies its signature once."""
+        token, jti = create_access_token(data={"sub": "user-id"})
+        spy = mocker.spy(jwt, "decode")
+
+        first = decode_token(token)
+        second = decode_token(token)
+
+        assert first is not None
+        assert first == second
+        assert first["jti"] == jti
+        assert spy.call_count == 1
+
+    def test_decode_token_returns_copy(self):
+        """Test that mutating a decoded payload does not affect the cache."""
+        token, _ = create_access_token(data={"sub": "user-id"})
+
+        payload = decode_token(token)
+        assert payload is not None
+        payload["sub"] = "someone-else"
+
+        assert decode_token(token)["sub"] == "user-id"  # type: ignore[index]
+
+    def test_decode_token_expired_after_caching(self, mocker):
+        """Test that a cached token is rejected once it expires."""
+        token, _ = create_access_token(data={"sub": "user-id"})
+        payload = decode_token(token)
+        assert payload is not None
+
+        mocker.patch("productivity_tracker.core.security.time.time", return_value=payload["exp"])
+
+        assert decode_token(token) is None
+
+    def test_decode_token_invalid(self):
+        """Test that an invalid token is rejected and not cached."""
+        assert decode_token("invalid_token") is None
+        assert _decode_verified.cache_info().currsize == 0
+
+    def test_decode_token_expired(self):
+        """Test that an already expired token is rejected."""
+        token, _ = create_access_token(data={"sub": "user-id"}, expires_delta=timedelta(seconds=-1))
+
+        assert decode_token(token) is None
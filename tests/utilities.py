@@ -152,6 +152,27 @@ def assert_permission_response(response_data: dict, expected_name: str | None =
         assert response_data["name"] == expected_name
 
 
+def assert_json_response(response: Any, expected_status: int, **expected_fields: Any) -> Any:
+    """
+    Assert a response's status code and top-level JSON fields.
+
+    Args:
+        response: The HTTP response
+        expected_status: Expected HTTP status code
+        **expected_fields: Field values the JSON body must contain
+
+    Returns:
+        The parsed JSON body
+    """
+    assert response.status_code == expected_status, (
+        f"Expected status {expected_status}, got {response.status_code}: {response.text}"
+    )
+    body = response.json()
+    for field, expected in expected_fields.items():
+        assert body[field] == expected, f"Expected {field} {expected!r}, got {body[field]!r}"
+    return body
+
+
 def get_auth_headers(access_token: str) -> dict[str, str]:
     """Get authorization headers for API requests."""
     return {"Authorization": f"Bearer {access_token}"}